@@ -9,6 +9,7 @@ from .deleted_asset import DeletedAsset  # noqa: F401
 from .deleted_entry import DeletedEntry  # noqa: F401
 from .content_type_cache import ContentTypeCache  # noqa: F401
 from .content_type_field import ContentTypeField  # noqa: F401
+from .http_cache import HTTPCache  # noqa: F401
 
 
 __version__ = "2.5.0"
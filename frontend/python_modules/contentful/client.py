@@ -2,6 +2,7 @@ import base64
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
 import platform
 from re import sub
 from .utils import ConfigurationException
@@ -9,6 +10,7 @@ from .utils import retry_request, string_class
 from .errors import get_error, RateLimitExceededError, EntryNotFoundError
 from .resource_builder import ResourceBuilder
 from .content_type_cache import ContentTypeCache
+from .http_cache import HTTPCache
 
 
 """
@@ -55,6 +57,9 @@ class Client(object):
     :param reuse_entries: (optional) Boolean determining wether to reuse
         hydrated Entry and Asset objects within the same request when possible.
         Defaults to False
+    :param lazy_fields: (optional) Boolean determining wether Entry and Asset
+        fields are coerced (and their links resolved) on first access instead
+        of when the response is built. Defaults to False
     :param timeout_s: (optional) Max time allowed for each API call, in seconds.
         Defaults to 1s.
     :param proxy_host: (optional) URL for Proxy, defaults to None.
@@ -72,6 +77,14 @@ class Client(object):
     :param integration_name: (optional) Integration name, defaults to None.
     :param integration_version: (optional) Integration version, defaults to None.
     :param additional_tokens: (optional) Additional tokens to be sent in the headers for resource resolution, defaults to None.
+    :param http_cache: (optional) Directory path or :class:`HTTPCache <contentful.http_cache.HTTPCache>`
+        object for an on-disk GET response cache revalidated with ETag/Last-Modified,
+        defaults to None (disabled).
+    :param session: (optional) :class:`requests.Session` to send requests with.
+        An injected session is left open by :meth:`close`, defaults to None
+        (the client creates and owns its own pooled session).
+    :param pool_size: (optional) Maximum number of pooled keep-alive connections
+        per host for the client's own session, defaults to 10.
     :return: :class:`Client <Client>` object.
     :rtype: contentful.Client
 
@@ -99,6 +112,7 @@ class Client(object):
             raise_errors=True,
             content_type_cache=True,
             reuse_entries=False,
+            lazy_fields=False,
             timeout_s=1,
             proxy_host=None,
             proxy_port=None,
@@ -111,7 +125,10 @@ class Client(object):
             application_version=None,
             integration_name=None,
             integration_version=None,
-            additional_tokens=None):
+            additional_tokens=None,
+            http_cache=None,
+            session=None,
+            pool_size=10):
         self.space_id = space_id
         self.access_token = access_token
         self.api_url = api_url
@@ -125,6 +142,7 @@ class Client(object):
         self.raise_errors = raise_errors
         self.content_type_cache = content_type_cache
         self.reuse_entries = reuse_entries
+        self.lazy_fields = lazy_fields
         self.timeout_s = timeout_s
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
@@ -138,11 +156,37 @@ class Client(object):
         self.integration_name = integration_name
         self.integration_version = integration_version
         self.additional_tokens = additional_tokens
+        if http_cache is not None and not isinstance(http_cache, HTTPCache):
+            http_cache = HTTPCache(http_cache)
+        self.http_cache = http_cache
+        self.pool_size = pool_size
+        self._owns_session = session is None
+        self.session = session if session is not None else self._build_session()
 
         self._validate_configuration()
         if self.content_type_cache:
             self._cache_content_types()
 
+    def close(self):
+        """Closes the pooled connections of the client's own session.
+
+        Sessions injected through the ``session`` parameter are left open.
+
+        Usage:
+
+            >>> with contentful.Client('cfexampleapi', 'b4c0n73n7fu1') as client:
+            ...     client.entries()
+        """
+
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def space(self, query=None):
         """Fetches the current Space.
 
@@ -497,6 +541,21 @@ class Client(object):
                 'The API Version must be a positive number'
             )
 
+    def _build_session(self):
+        """
+        Creates the long-lived Session, so consecutive requests reuse
+        keep-alive connections instead of a new TCP/TLS handshake each.
+        """
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     def _cache_content_types(self):
         """
         Updates the Content Type Cache.
@@ -622,7 +681,17 @@ class Client(object):
         if self._has_proxy():
             kwargs['proxies'] = self._proxy_parameters()
 
-        response = requests.get(
+        cache_key = None
+        cached = None
+        if self.http_cache is not None:
+            cache_key = self.http_cache.key(self._url(url), query)
+            cached = self.http_cache.get(cache_key)
+            if cached is not None:
+                kwargs['headers'].update(
+                    self.http_cache.conditional_headers(cached)
+                )
+
+        response = self.session.get(
             self._url(url),
             **kwargs
         )
@@ -630,6 +699,12 @@ class Client(object):
         if response.status_code == 429:
             raise RateLimitExceededError(response)
 
+        if self.http_cache is not None:
+            if response.status_code == 304 and cached is not None:
+                response = self.http_cache.replay(cache_key, cached, response)
+            elif response.status_code == 200:
+                self.http_cache.store(cache_key, response)
+
         return response
 
     def _get(self, url, query=None):
@@ -659,7 +734,8 @@ class Client(object):
             localized,
             response.json(),
             max_depth=self.max_include_resolution_depth,
-            reuse_entries=self.reuse_entries
+            reuse_entries=self.reuse_entries,
+            lazy_fields=self.lazy_fields
         ).build()
 
     def _has_proxy(self):
@@ -737,7 +813,7 @@ class Client(object):
         if self._has_proxy():
             kwargs['proxies'] = self._proxy_parameters()
 
-        response = requests.post(
+        response = self.session.post(
             self._url(url),
             **kwargs
         )
@@ -772,5 +848,6 @@ class Client(object):
             False,
             response.json(),
             max_depth=self.max_include_resolution_depth,
-            reuse_entries=self.reuse_entries
+            reuse_entries=self.reuse_entries,
+            lazy_fields=self.lazy_fields
         ).build()
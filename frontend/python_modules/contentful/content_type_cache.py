@@ -35,4 +35,13 @@ class ContentTypeCache(object):
         Updates the Cache with all Content Types from the Space.
         """
 
-        cls.__CACHE__[client.space_id] = client.content_types()
+        content_types = client.content_types()
+        if client.raw_mode:
+            # Raw mode returns the bare HTTP response, the cache needs ContentType objects
+            from .resource_builder import ResourceBuilder
+            content_types = ResourceBuilder(
+                client.default_locale,
+                False,
+                content_types.json()
+            ).build()
+        cls.__CACHE__[client.space_id] = content_types
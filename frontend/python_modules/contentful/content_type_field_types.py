@@ -163,7 +163,7 @@ class RichTextField(BasicField):
     Coerces Rich Text fields and resolves includes for entries included.
     """
 
-    def _coerce_link(self, value, includes=None, errors=None, resources=None, default_locale='en-US', locale=None):
+    def _coerce_link(self, value, includes=None, errors=None, resources=None, default_locale='en-US', locale=None, lazy_fields=False):
         if value['data']['target']['sys']['type'] != 'Link':
             return value['data']['target']
 
@@ -191,19 +191,22 @@ class RichTextField(BasicField):
             includes_for_single=includes,
             errors_for_single=errors,
             reuse_entries=bool(resources),
-            resources=resources
+            resources=resources,
+            lazy_fields=lazy_fields
         ).build()
 
-    def _coerce_block(self, value, includes=None, errors=None, resources=None, default_locale='en-US', locale=None):
+    def _coerce_block(self, value, includes=None, errors=None, resources=None, default_locale='en-US', locale=None, lazy_fields=False):
+        # Builds new nodes along the way instead of rewriting `value`, so the
+        # response JSON (shared with Resource.raw and other resources) is left as is
         if not (isinstance(value, dict) and 'content' in value):
             return value
 
-        invalid_nodes = []
-        coerced_nodes = {}
-        for index, node in enumerate(value['content']):
+        content = []
+        for node in value['content']:
             if node.get('data', None) and node['data'].get('target', None):
                 # Resource has already been hydrated previously
                 if isinstance(node['data']['target'], Resource):
+                    content.append(node)
                     continue
 
                 link = self._coerce_link(
@@ -212,31 +215,27 @@ class RichTextField(BasicField):
                     errors=errors,
                     resources=resources,
                     default_locale=default_locale,
-                    locale=locale
+                    locale=locale,
+                    lazy_fields=lazy_fields
                 )
-                if link:
-                    node['data']['target'] = link
-                else:
-                    invalid_nodes.append(index)
+                if not link:
+                    continue
+                node = dict(node, data=dict(node['data'], target=link))
             if node.get('content', None):
-                coerced_nodes[index] = self._coerce_block(
+                node = self._coerce_block(
                     node,
                     includes=includes,
                     errors=errors,
                     resources=resources,
                     default_locale=default_locale,
-                    locale=locale
+                    locale=locale,
+                    lazy_fields=lazy_fields
                 )
+            content.append(node)
 
-        for node_index, coerced_node in coerced_nodes.items():
-            value['content'][node_index] = coerced_node
-
-        for node_index in reversed(invalid_nodes):
-            del value['content'][node_index]
-
-        return value
+        return dict(value, content=content)
 
-    def coerce(self, value, includes=None, errors=None, resources=None, default_locale='en-US', locale=None):
+    def coerce(self, value, includes=None, errors=None, resources=None, default_locale='en-US', locale=None, lazy_fields=False):
         """Coerces Rich Text properly."""
 
         if includes is None:
@@ -250,5 +249,6 @@ class RichTextField(BasicField):
             errors=errors,
             resources=resources,
             default_locale=default_locale,
-            locale=locale
+            locale=locale,
+            lazy_fields=lazy_fields
         )
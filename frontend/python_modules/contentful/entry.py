@@ -71,7 +71,8 @@ class Entry(FieldsResource):
                     errors=errors,
                     resources=resources,
                     default_locale=self.default_locale,
-                    locale=self.sys.get('locale', '*')
+                    locale=self.sys.get('locale', '*'),
+                    lazy_fields=self._lazy_fields
                 )
 
         return super(Entry, self)._coerce(
@@ -124,7 +125,8 @@ class Entry(FieldsResource):
             reuse_entries=bool(resources),
             resources=resources,
             depth=self._depth + 1,
-            max_depth=self._max_depth
+            max_depth=self._max_depth,
+            lazy_fields=self._lazy_fields
         ).build()
 
     def incoming_references(self, client=None, query=None):
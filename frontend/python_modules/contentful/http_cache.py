@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from six.moves.urllib.parse import urlencode
+
+
+"""
+contentful.http_cache
+~~~~~~~~~~~~~~~~~~~~~
+
+This module implements the HTTPCache class, an opt-in on-disk cache for
+GET responses that revalidates with ETag / Last-Modified.
+"""
+
+
+class HTTPCache(object):
+    """On-disk response cache with conditional revalidation.
+
+    Each response body is stored next to a small JSON file holding its
+    ``ETag`` and ``Last-Modified`` headers. Later requests for the same
+    URL and query send ``If-None-Match`` / ``If-Modified-Since``, and a
+    ``304 Not Modified`` is answered from disk. Once the stored bodies
+    exceed ``max_size`` bytes, the least recently used ones are evicted.
+
+    :param path: Directory for the cache files, created if missing.
+    :param max_size: (optional) Upper bound for the total size of cached
+        bodies, in bytes. Defaults to 100MB.
+
+    Usage:
+
+        >>> client = contentful.Client(
+        ...     'cfexampleapi', 'b4c0n73n7fu1',
+        ...     http_cache=HTTPCache('.cache/contentful-http'))
+    """
+
+    def __init__(self, path, max_size=100 * 1024 * 1024):
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # In-memory LRU of key -> body size (least recently used first) and
+        # its running total, loaded from one directory scan on first use
+        self._sizes = None
+        self._total = 0
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    def key(self, url, query=None):
+        """Returns the cache key for a URL and its (already normalized) query."""
+
+        items = sorted((str(k), str(v)) for k, v in (query or {}).items())
+        raw = '{0}?{1}'.format(url, urlencode(items))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Returns the cached entry for ``key``, or None."""
+
+        try:
+            with open(self._meta_path(key), 'r') as f:
+                meta = json.load(f)
+            with open(self._body_path(key), 'rb') as f:
+                meta['body'] = f.read()
+        except (IOError, OSError, ValueError):
+            return None
+        return meta
+
+    def conditional_headers(self, entry):
+        """Returns the revalidation headers for a cached entry."""
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, key, response):
+        """Stores a successful response if it carries validators."""
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        meta = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'url': response.url
+        }
+        with self._lock:
+            self._write(self._body_path(key), response.content, 'wb')
+            self._write(self._meta_path(key), json.dumps(meta), 'w')
+            self._track(key, len(response.content))
+            self._evict()
+
+    def replay(self, key, entry, response):
+        """Turns a 304 response into the cached 200 response."""
+
+        response.status_code = 200
+        response.reason = 'OK'
+        response._content = entry['body']
+        response.encoding = 'utf-8'
+        try:
+            # Bump the access time so LRU eviction keeps hot entries.
+            os.utime(self._body_path(key), None)
+        except OSError:
+            pass
+        with self._lock:
+            if self._sizes is not None and key in self._sizes:
+                self._sizes.move_to_end(key)
+        return response
+
+    def clear(self):
+        """Removes every cached entry."""
+
+        with self._lock:
+            for name in os.listdir(self.path):
+                self._remove(os.path.join(self.path, name))
+            self._sizes = OrderedDict()
+            self._total = 0
+
+    def _body_path(self, key):
+        return os.path.join(self.path, '{0}.body'.format(key))
+
+    def _meta_path(self, key):
+        return os.path.join(self.path, '{0}.json'.format(key))
+
+    def _write(self, path, data, mode):
+        tmp_path = '{0}.{1}.tmp'.format(path, threading.current_thread().ident)
+        with open(tmp_path, mode) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _scan(self):
+        """(mtime, size, key) for every stored body."""
+
+        bodies = []
+        for name in os.listdir(self.path):
+            if not name.endswith('.body'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except OSError:
+                continue
+            bodies.append((stat.st_mtime, stat.st_size, name[:-len('.body')]))
+        return bodies
+
+    def _track(self, key, size):
+        if self._sizes is None:
+            # The body was just written, so the scan already includes it
+            self._sizes = OrderedDict((k, s) for _, s, k in sorted(self._scan()))
+            self._total = sum(self._sizes.values())
+        else:
+            self._total += size - self._sizes.pop(key, 0)
+            self._sizes[key] = size
+        self._sizes.move_to_end(key)
+
+    def _evict(self):
+        while self._total > self.max_size and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self._remove(self._body_path(key))
+            self._remove(self._meta_path(key))
+            self._total -= size
+
+    def __repr__(self):
+        return "<HTTPCache path='{0}' max_size={1}>".format(
+            self.path,
+            self.max_size
+        )
@@ -1,3 +1,5 @@
+import copy
+
 import dateutil.parser
 
 from .utils import snake_case
@@ -35,8 +37,10 @@ class Resource(object):
             resources=None,
             depth=0,
             max_depth=20):
-        import copy
-        self.raw = copy.deepcopy(item)
+        # raw is copied from item on first access rather than for every
+        # resource: hydration doesn't modify item, so the copy comes out the same
+        self._raw_item = item
+        self._raw = None
         self.default_locale = default_locale
         self._depth = depth
         self._max_depth = max_depth
@@ -51,6 +55,20 @@ class Resource(object):
             )
             resources[cache_key] = self
 
+    @property
+    def raw(self):
+        """The JSON this resource was built from (a copy of it)."""
+
+        if self._raw is None:
+            self._raw = copy.deepcopy(self._raw_item)
+            self._raw_item = None
+        return self._raw
+
+    @raw.setter
+    def raw(self, value):
+        self._raw = value
+        self._raw_item = None
+
     def _hydrate_sys(self, item):
         sys = {}
         for k, v in item.get('sys', {}).items():
@@ -88,6 +106,10 @@ class Resource(object):
         return self.__dict__
 
     def __setstate__(self, d):
+        if 'raw' in d:  # pickled before raw was copied lazily
+            d = dict(d)
+            d['_raw'] = d.pop('raw')
+            d['_raw_item'] = None
         self.__dict__ = d
 
 
@@ -95,6 +117,11 @@ class FieldsResource(Resource):
     """Fields Resource Class
 
     Implements locale handling for Resource fields.
+
+    With lazy_fields, fields are coerced (and their links resolved) on
+    first access instead of at construction: one field for an attribute
+    lookup, all fields of the locale for :meth:`fields`. Coerced values
+    are memoized.
     """
     def __init__(
             self,
@@ -103,6 +130,7 @@ class FieldsResource(Resource):
             errors=None,
             localized=False,
             resources=None,
+            lazy_fields=False,
             **kwargs):
         super(FieldsResource, self).__init__(
             item,
@@ -113,7 +141,58 @@ class FieldsResource(Resource):
             **kwargs
         )
 
-        self._fields = self._hydrate_fields(item, localized, includes, errors, resources=resources)
+        self._lazy_fields = lazy_fields
+        if lazy_fields:
+            self._fields = {}
+            self._pending_fields = self._raw_fields(item, localized)
+            self._hydration = (localized, includes, errors, resources)
+        else:
+            self._fields = self._hydrate_fields(item, localized, includes, errors, resources=resources)
+
+    def _raw_fields(self, item, localized):
+        """Uncoerced field values by locale and snake_cased name, in hydration order."""
+
+        if 'fields' not in item:
+            return {}
+
+        fields = {self._locale(): {}}
+        for k, v in item['fields'].items():
+            name = snake_case(k)
+            if localized:
+                for locale, locale_value in v.items():
+                    fields.setdefault(locale, {})[name] = locale_value
+            else:
+                fields[self._locale()][name] = v
+        return fields
+
+    def _hydrate_field(self, locale, name):
+        """Coerces a pending field once and memoizes it."""
+
+        hydrated = self._fields.setdefault(locale, {})
+        if name not in hydrated:
+            localized, includes, errors, resources = self._hydration
+            hydrated[name] = self._coerce(
+                name,
+                self._pending_fields[locale][name],
+                localized,
+                includes if includes is not None else [],
+                errors if errors is not None else [],
+                resources=resources
+            )
+        return hydrated[name]
+
+    def _hydrate_locale(self, locale):
+        """Coerces every pending field of a locale, keeping the eager field order."""
+
+        pending = self._pending_fields.get(locale)
+        if pending is None:
+            return
+        self._fields[locale] = dict(
+            (name, self._hydrate_field(locale, name)) for name in pending
+        )
+        del self._pending_fields[locale]
+        if not self._pending_fields:
+            self._hydration = None  # drop the references to the response
 
     def _hydrate_fields(self, item, localized, includes, errors, resources=None):
         if 'fields' not in item:
@@ -135,11 +214,12 @@ class FieldsResource(Resource):
 
     def _hydrate_localized_entry(self, fields, item, includes, errors, resources=None):
         for k, locales in item['fields'].items():
+            name = snake_case(k)
             for locale, v in locales.items():
                 if locale not in fields:
                     fields[locale] = {}
-                fields[locale][snake_case(k)] = self._coerce(
-                    snake_case(k),
+                fields[locale][name] = self._coerce(
+                    name,
                     v,
                     True,
                     includes,
@@ -148,9 +228,11 @@ class FieldsResource(Resource):
                 )
 
     def _hydrate_non_localized_entry(self, fields, item, includes, errors, resources=None):
+        locale = self._locale()
         for k, v in item['fields'].items():
-            fields[self._locale()][snake_case(k)] = self._coerce(
-                snake_case(k),
+            name = snake_case(k)
+            fields[locale][name] = self._coerce(
+                name,
                 v,
                 False,
                 includes,
@@ -169,6 +251,8 @@ class FieldsResource(Resource):
 
         if locale is None:
             locale = self._locale()
+        if self.__dict__.get('_lazy_fields'):
+            self._hydrate_locale(locale)
         return self._fields.get(locale, {})
 
     @property
@@ -182,8 +266,16 @@ class FieldsResource(Resource):
         locale = self._locale()
         if name in self._fields.get(locale, {}):
             return self._fields[locale][name]
+        if name in self.__dict__.get('_pending_fields', {}).get(locale, {}):
+            return self._hydrate_field(locale, name)
         return super(FieldsResource, self).__getattr__(name)
 
+    def __getstate__(self):
+        if self.__dict__.get('_lazy_fields'):
+            for locale in list(self._pending_fields):
+                self._hydrate_locale(locale)
+        return super(FieldsResource, self).__getstate__()
+
 
 class Link(Resource):
     """Link Class
@@ -2,13 +2,14 @@ from .array import Array
 from .asset_key import AssetKey
 from .entry import Entry
 from .asset import Asset
+from .resource import FieldsResource
 from .space import Space
 from .content_type import ContentType
 from .deleted_asset import DeletedAsset
 from .deleted_entry import DeletedEntry
 from .locale import Locale
 from .sync_page import SyncPage
-from .utils import unresolvable
+from .utils import unresolvable, ErrorsIndex, IncludesIndex
 from .taxonomy_concept import TaxonomyConcept
 from .taxonomy_concept_scheme import TaxonomyConceptScheme
 
@@ -37,7 +38,8 @@ class ResourceBuilder(object):
             reuse_entries=False,
             resources=None,
             depth=0,
-            max_depth=20):
+            max_depth=20,
+            lazy_fields=False):
         self.default_locale = default_locale
         self.localized = localized
         self.json = json
@@ -46,10 +48,12 @@ class ResourceBuilder(object):
         self.reuse_entries = reuse_entries
         self.depth = depth
         self.max_depth = max_depth
+        self.lazy_fields = lazy_fields
 
         if resources is None:
             resources = {} if self.reuse_entries else None
         self.resources = resources
+        self._error_index = None
 
     def build(self):
         """Creates the objects from the JSON response"""
@@ -70,8 +74,12 @@ class ResourceBuilder(object):
         errors = []
         if self.includes_for_single is not None:
             includes = self.includes_for_single
+        if not isinstance(includes, IncludesIndex):
+            includes = IncludesIndex(includes)
         if self.errors_for_single is not None:
             errors = self.errors_for_single
+        if not isinstance(errors, ErrorsIndex):
+            errors = ErrorsIndex(errors)
 
         return self._build_item(
             self.json,
@@ -88,7 +96,7 @@ class ResourceBuilder(object):
                     includes=includes,
                     errors=errors
                  ) for item in self.json['items']
-                 if not unresolvable(item, self._errors())]
+                 if not unresolvable(item, errors)]
 
         return Array(self.json, items)
 
@@ -115,7 +123,11 @@ class ResourceBuilder(object):
             return resource
 
         if item['sys']['type'] in buildables:
-            return buildables[item['sys']['type']](
+            resource_class = buildables[item['sys']['type']]
+            kwargs = {}
+            if self.lazy_fields and issubclass(resource_class, FieldsResource):
+                kwargs['lazy_fields'] = True
+            return resource_class(
                 item,
                 default_locale=self.default_locale,
                 localized=self.localized,
@@ -123,7 +135,8 @@ class ResourceBuilder(object):
                 errors=errors,
                 resources=self.resources,
                 depth=self.depth,
-                max_depth=self.max_depth
+                max_depth=self.max_depth,
+                **kwargs
             )
 
     def _resource_from_cache(self, item):
@@ -136,20 +149,31 @@ class ResourceBuilder(object):
             return self.resources[cache_key]
 
     def _includes(self):
+        """
+        Items and includes of the response, indexed once so that nested
+        resources resolve their links by id instead of scanning this list.
+        """
+
         includes = list(self.json['items'])
         for e in ['Entry', 'Asset']:
             if e in self.json.get('includes', {}):
                 includes += [item for item in self.json['includes'].get(e, [])
                              if not unresolvable(item, self._errors())]
-        return includes
+        return IncludesIndex(includes)
 
     def _errors(self):
-        errors = []
-        if self.errors_for_single is not None:
-            errors = self.errors_for_single
-        errors += self.json.get('errors', [])
-
-        return errors
+        """
+        Errors of the response (after those passed in errors_for_single),
+        indexed once per builder so every unresolvable() check is a set lookup.
+        """
+
+        if self._error_index is None:
+            errors = self.errors_for_single if self.errors_for_single is not None else []
+            own_errors = self.json.get('errors', [])
+            if own_errors or not isinstance(errors, ErrorsIndex):
+                errors = ErrorsIndex(list(errors) + own_errors)
+            self._error_index = errors
+        return self._error_index
 
     def _build_asset_key(self):
         """Creates an AssetKey Resource."""
@@ -27,7 +27,7 @@ class SyncPage(Resource):
         self.next_sync_url = item.get('nextSyncUrl', '')
         self.next_page_url = item.get('nextPageUrl', '')
         self.next_sync_token = self._get_sync_token()
-        self.items = self._hydrate_items()
+        self.items = self._hydrate_items(item)
 
     def next(self, client):
         """Fetches next SyncPage
@@ -44,10 +44,10 @@ class SyncPage(Resource):
         querystring = parse_qs(url_parts.query)
         return querystring['sync_token'][0]
 
-    def _hydrate_items(self):
+    def _hydrate_items(self, page):
         from .resource_builder import ResourceBuilder
         items = []
-        for item in self.raw.get('items', []):
+        for item in page.get('items', []):
             items.append(
                 ResourceBuilder(
                     self.default_locale,
@@ -53,6 +53,14 @@ def json_error_class():
     return ValueError
 
 
+# Process-wide memo for snake_case(). sys, metadata and field keys are a
+# small set repeated on every resource (field ids are added as soon as the
+# content type cache is filled, via ContentTypeField); the bound only keeps
+# unusual inputs from growing it forever.
+SNAKE_CASE_CACHE_SIZE = 4096
+_snake_case_cache = {}
+
+
 def snake_case(a_string):
     """Returns a snake cased version of a string.
 
@@ -63,8 +71,13 @@ def snake_case(a_string):
         "foo_bar"
     """
 
-    partial = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', a_string)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', partial).lower()
+    snake = _snake_case_cache.get(a_string)
+    if snake is None:
+        partial = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', a_string)
+        snake = re.sub('([a-z0-9])([A-Z])', r'\1_\2', partial).lower()
+        if len(_snake_case_cache) < SNAKE_CASE_CACHE_SIZE:
+            _snake_case_cache[a_string] = snake
+    return snake
 
 
 def is_link(value):
@@ -128,10 +141,38 @@ def is_link_array(value):
     return False
 
 
+class ErrorsIndex(list):
+    """
+    The errors of a response, with the ids and urns they report collected
+    once.
+
+    Still a list, so it can be passed wherever errors are expected;
+    :func:`unresolvable` checks items against it with set lookups instead
+    of looping over every error. The sets are not updated if the list is
+    modified afterwards.
+    """
+
+    def __init__(self, errors=()):
+        super(ErrorsIndex, self).__init__(errors)
+        details = [error.get('details', {}) for error in self]
+        self._ids = set(d.get('id', None) for d in details)
+        self._urns = set(d.get('urn', None) for d in details)
+
+    def reports(self, item):
+        """True if an error reports the item (by id, or else by urn)."""
+
+        sys = item['sys']
+        return (('id' in sys and sys['id'] in self._ids) or
+                ('urn' in sys and sys['urn'] in self._urns))
+
+
 def unresolvable(item, errors):
     if not item:
         return True
 
+    if isinstance(errors, ErrorsIndex):
+        return errors.reports(item)
+
     for error in errors:
         if 'id' in item['sys'] and (error.get('details', {}).get('id', None) == item['sys']['id']):
             return True
@@ -140,6 +181,42 @@ def unresolvable(item, errors):
     return False
 
 
+class IncludesIndex(list):
+    """
+    The includes of a response, indexed once by id and by type + id.
+
+    Still a list, so it can be passed wherever includes are expected;
+    :func:`resource_for_link` resolves links against it with two dict
+    lookups instead of scanning every include. The index is not updated
+    if the list is modified afterwards.
+    """
+
+    def __init__(self, includes=()):
+        super(IncludesIndex, self).__init__(includes)
+        self._by_type_and_id = {}
+        self._by_id = {}
+        for position, item in enumerate(self):
+            sys = item['sys']
+            if 'id' not in sys:
+                continue
+            # First occurrence wins, as in a scan of the list
+            self._by_type_and_id.setdefault((sys.get('type'), sys['id']), (position, item))
+            self._by_id.setdefault(sys['id'], (position, item))
+
+    def find(self, link):
+        """Returns the include a scan of the list would match for the link, or None."""
+
+        link_sys = link['sys']
+        found = None
+        if 'id' in link_sys:
+            found = self._by_type_and_id.get((link_sys.get('linkType'), link_sys['id']))
+        if 'urn' in link_sys:
+            by_urn = self._by_id.get(link_sys['urn'].split('/')[-1])
+            if by_urn is not None and (found is None or by_urn[0] < found[0]):
+                found = by_urn
+        return found[1] if found is not None else None
+
+
 def resource_for_link(link, includes, resources=None, locale=None):
     """Returns the resource that matches the link"""
 
@@ -161,6 +238,9 @@ def resource_for_link(link, includes, resources=None, locale=None):
         if cache_key_urn in resources:
             return resources[cache_key_urn]
 
+    if isinstance(includes, IncludesIndex):
+        return includes.find(link)
+
     # Search through includes
     for i in includes:
         if ('id' in i['sys'] and 'id' in link['sys'] and
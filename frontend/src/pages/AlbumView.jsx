@@ -1,35 +1,34 @@
 import { useEffect, useMemo, useState } from "react";
 import { Link, useParams } from "react-router-dom";
 
-function slugify(str = "") {
-  return str.toLowerCase().trim().replace(/[^a-z0-9]+/g, "-").replace(/(^-|-$)+/g, "");
-}
-
 export default function AlbumView() {
   const { albumSlug } = useParams();
-  const [data, setData] = useState(null);
+  const [album, setAlbum] = useState(undefined); // undefined = loading, null = not found
   const [lightboxIndex, setLightboxIndex] = useState(null); // null | number
 
   useEffect(() => {
-    fetch("/albums.json")
-      .then((r) => r.json())
-      .then(setData)
-      .catch((e) => console.error("albums.json load failed", e));
-  }, []);
-
-  const album = useMemo(() => {
-    if (!data) return null;
-    return (data.albums || []).find((a) => slugify(a.name) === albumSlug) || null;
-  }, [data, albumSlug]);
-
-  // Flatten photos from items (fallback to assets[].url if photos not present)
+    setAlbum(undefined);
+    // One shard per album, written by src/scripts/gallery.py
+    fetch(`/albums/${encodeURIComponent(albumSlug)}.json`)
+      .then((r) => (r.ok ? r.json() : null))
+      .then(setAlbum)
+      .catch((e) => {
+        // Unknown slugs fall through to the SPA rewrite and return HTML
+        console.error(`albums/${albumSlug}.json load failed`, e);
+        setAlbum(null);
+      });
+  }, [albumSlug]);
+
+  // Flatten photos from items; assets[] also carry a srcset of resized variants (fallback to plain photos URLs)
   const photos = useMemo(() => {
     if (!album?.items?.length) return [];
     return album.items.flatMap((it) => {
-      const urls = (it.photos && it.photos.length ? it.photos : (it.assets || []).map(a => a.url)) || [];
-      return urls.map((url, idx) => ({
+      const assets = (it.assets || []).filter((a) => a.url);
+      const list = assets.length ? assets : (it.photos || []).map((url) => ({ url }));
+      return list.map((a, idx) => ({
         id: `${it.id}-${idx}`,
-        url,
+        url: a.url,
+        srcset: a.srcset,
         title: it.title || album.name
       }));
     });
@@ -48,7 +47,7 @@ export default function AlbumView() {
     return () => window.removeEventListener("keydown", onKey);
   }, [lightboxIndex, photos]);
 
-  if (!data) {
+  if (album === undefined) {
     return <div className="p-6 text-[#0e5a96]">Loading…</div>;
   }
 
@@ -102,6 +101,10 @@ export default function AlbumView() {
             >
               <img
                 src={p.url || "/placeholder.png"}
+                srcSet={p.srcset || undefined}
+                // Matches the grid columns below (1 / 2 / 3 / 4 per row)
+                sizes="(min-width: 1280px) 25vw, (min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
+                loading="lazy"
                 alt={p.title || album.name}
                 className="w-full h-56 object-cover"
               />
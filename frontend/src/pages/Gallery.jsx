@@ -1,29 +1,68 @@
-import { useEffect, useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import { Link, useSearchParams } from "react-router-dom";
 import bgHero from "../assets/images/bg4.jpg";
 
-function slugify(str = "") {
-  return str.toLowerCase().trim().replace(/[^a-z0-9]+/g, "-").replace(/(^-|-$)+/g, "");
+// Same tokenization as search_index.tokenize(): lowercased runs of letters/digits
+const tokenize = (text) => (text || "").toLowerCase().match(/[\p{L}\p{N}]+/gu) ?? [];
+
+// Slugs of albums with an index token starting with every word of the query (null: nothing to match on)
+function searchAlbums(index, q) {
+  const words = tokenize(q);
+  if (!words.length) return null;
+  let hits = null;
+  for (const word of words) {
+    // keys are sorted: binary-search the first key >= word, then walk the prefix range
+    let lo = 0;
+    let hi = index.keys.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (index.keys[mid] < word) lo = mid + 1;
+      else hi = mid;
+    }
+    const matched = new Set();
+    for (let i = lo; i < index.keys.length && index.keys[i].startsWith(word); i++) {
+      for (const pos of index.tokens[index.keys[i]]) matched.add(pos);
+    }
+    hits = hits ? new Set([...hits].filter((pos) => matched.has(pos))) : matched;
+    if (!hits.size) break;
+  }
+  return new Set([...hits].map((pos) => index.albums[pos]));
 }
 
 export default function Gallery() {
   const [data, setData] = useState(null);
+  const [index, setIndex] = useState(null);
+  const indexRequested = useRef(false);
   const [params, setParams] = useSearchParams();
   const q = params.get("q") ?? "";
 
   useEffect(() => {
-    fetch("/albums.json")
+    // Small per-album summaries (name, slug, count, cover); photos live in /albums/<slug>.json
+    fetch("/albums/index.json")
       .then((r) => r.json())
       .then(setData)
-      .catch((e) => console.error("albums.json load failed", e));
+      .catch((e) => console.error("albums/index.json load failed", e));
   }, []);
 
+  useEffect(() => {
+    // Token index over album names, item titles and asset titles; only needed once someone searches
+    if (!q || indexRequested.current) return;
+    indexRequested.current = true;
+    fetch("/albums/search.json")
+      .then((r) => r.json())
+      .then((d) => setIndex({ ...d, keys: Object.keys(d.tokens).sort() }))
+      .catch((e) => console.error("albums/search.json load failed", e));
+  }, [q]);
+
   const albums = data?.albums ?? [];
   const filtered = useMemo(() => {
     if (!q) return albums;
+    const slugs = index ? searchAlbums(index, q) : null;
+    if (slugs) return albums.filter((a) => slugs.has(a.slug));
+    // Until the index is in (or if it failed to load), match album names directly
     const qq = q.toLowerCase();
     return albums.filter((a) => a.name.toLowerCase().includes(qq));
-  }, [albums, q]);
+  }, [albums, index, q]);
 
   return (
     <div className="min-h-screen bg-white !font-sans text-[#0e5a96]">
@@ -56,18 +95,22 @@ export default function Gallery() {
       {/* Album banners */}
       <div className="max-w-7xl mx-auto mt-10 px-4 md:px-8 space-y-6">
         {filtered.map((album) => {
-          const firstItem = album.items?.[0];
-          const cover =
-            firstItem?.cover ||
-            firstItem?.photos?.[0] ||
-            "/default-banner.jpg"; // fallback for safety
+          const cover = album.cover || "/default-banner.jpg"; // fallback for safety
+          const placeholder = album.placeholder; // tiny preview + color, painted until the cover loads
 
-          const slug = slugify(album.name);
           return (
             <Link
-              key={album.name}
-              to={`/gallery/${slug}`}
-              className="relative block h-48 sm:h-56 md:h-64 lg:h-72 rounded-2xl overflow-hidden shadow-sm hover:shadow-lg transition"
+              key={album.slug}
+              to={`/gallery/${album.slug}`}
+              className="relative block h-48 sm:h-56 md:h-64 lg:h-72 rounded-2xl overflow-hidden shadow-sm hover:shadow-lg transition bg-cover bg-center"
+              style={
+                placeholder
+                  ? {
+                      backgroundColor: placeholder.color || undefined,
+                      backgroundImage: `url(${placeholder.preview})`,
+                    }
+                  : undefined
+              }
             >
               {/* Background */}
               <img
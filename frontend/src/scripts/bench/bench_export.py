@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+# frontend/src/scripts/bench/bench_export.py
+"""
+Offline benchmark for the export pipeline.
+
+    python3 src/scripts/bench/bench_export.py                  # compare against baseline.json
+    python3 src/scripts/bench/bench_export.py --scales 100,10000  # skip 100k on small machines
+    python3 src/scripts/bench/bench_export.py --update-baseline
+
+The CDA pages recorded under fixtures/ are cloned up to each scale
+(100, 10k and 100k entries per content type by default) and served by a
+requests transport adapter mounted on the client's Session, so no
+network is involved. Each scale runs in its own subprocess so peak RSS
+is per scale. The stages timed are events.fetch_all, events.build_payload,
+gallery.fetch_all_gallery_entries and gallery.build_albums.
+
+The 100k scale runs in about two minutes; what limits it is memory. Its
+subprocess peaks at roughly 4.5 GB RSS, because both exports' hydrated
+entries and assets are alive at once. On machines with less free memory,
+pass --scales 100,10000.
+
+Exits with status 1 when a stage is slower (or uses more memory) than
+baseline.json allows. Timings are machine-dependent: refresh the
+baseline with --update-baseline when switching machines, and commit it
+together with the change that moved the numbers.
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "python_modules"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import argparse
+import json
+import platform
+import random
+import resource
+import subprocess
+import threading
+import time
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+import contentful
+import events
+import gallery
+
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURES_DIR = BENCH_DIR / "fixtures"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+
+DEFAULT_SCALES = (100, 10_000, 100_000)
+STAGES = ("fetch_all", "build_payload", "fetch_all_gallery_entries", "build_albums")
+# Differences below this many seconds are treated as noise, whatever the ratio
+MIN_DELTA_S = 0.05
+
+
+def _load_fixture(name: str) -> dict:
+    with (FIXTURES_DIR / name).open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+# ---------- synthetic space ----------
+
+class SyntheticSpace:
+    """
+    `scale` church events and gallery entries (plus scale/4 assets) cloned from
+    the recorded pages. Ids, dates, categories and asset links are varied
+    deterministically, so every run at a given scale sees the same content.
+    """
+
+    def __init__(self, scale: int, seed: int = 2025):
+        rng = random.Random(seed)
+        self.content_types = _load_fixture("content_types.json")
+        self.space_id = self.content_types["items"][0]["sys"]["space"]["sys"]["id"]
+
+        asset_templates = _load_fixture("gallery.json")["includes"]["Asset"]
+        self.assets = {}
+        for i in range(max(len(asset_templates), scale // 4)):
+            asset = self._clone(asset_templates[i % len(asset_templates)], i)
+            file = asset["fields"]["file"]
+            file["url"] = file["url"].replace(asset_templates[i % len(asset_templates)]["sys"]["id"], asset["sys"]["id"])
+            self.assets[asset["sys"]["id"]] = asset
+        asset_ids = list(self.assets)
+
+        event_templates = _load_fixture("church_events.json")["items"]
+        first_start = datetime.fromisoformat(event_templates[0]["fields"]["startTime"])
+        event_items = []
+        for i in range(scale):
+            entry = self._clone(event_templates[i % len(event_templates)], i)
+            fields = entry["fields"]
+            start = first_start + timedelta(hours=7 * i)
+            fields["startTime"] = start.isoformat(timespec="minutes")
+            if i % 3 == 0:
+                fields["endTime"] = (start + timedelta(hours=2)).isoformat(timespec="minutes")
+            event_items.append(entry)
+        # The CDA does not promise any order without `order`, and events.py sorts locally
+        rng.shuffle(event_items)
+
+        gallery_templates = _load_fixture("gallery.json")["items"]
+        album_count = max(1, int(scale ** 0.5))
+        gallery_items = []
+        for i in range(scale):
+            entry = self._clone(gallery_templates[i % len(gallery_templates)], i)
+            fields = entry["fields"]
+            fields["category"] = f"{fields['category']} {i % album_count}"
+            # Neighbouring entries share photos, as re-used uploads do in the real space
+            fields["media"]["sys"]["id"] = asset_ids[(3 * i) % len(asset_ids)]
+            for n, photo in enumerate(fields["photos"]):
+                photo["sys"]["id"] = asset_ids[(3 * i + n + 1) % len(asset_ids)]
+            gallery_items.append(entry)
+
+        self.entries = {
+            "churchEvents": event_items,
+            "gallery": gallery_items,
+        }
+
+    @staticmethod
+    def _clone(template: dict, i: int) -> dict:
+        item = json.loads(json.dumps(template))
+        sys_ = item["sys"]
+        sys_["id"] = f"{sys_['id'][:14]}{i:08x}"
+        created = datetime.fromisoformat(sys_["createdAt"].replace("Z", "+00:00")) + timedelta(seconds=i)
+        sys_["createdAt"] = created.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        sys_["updatedAt"] = sys_["createdAt"]
+        return item
+
+
+# ---------- transport ----------
+
+def _lookup(item: dict, path: str):
+    value = item
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def _sortable(value):
+    if isinstance(value, str):
+        try:
+            return (0, datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+        except ValueError:
+            return (1, value)
+    return (2, value) if value is not None else (3, 0)
+
+_RANGE_OPS = {
+    "gte": lambda a, b: a >= b,
+    "lte": lambda a, b: a <= b,
+    "gt": lambda a, b: a > b,
+    "lt": lambda a, b: a < b,
+}
+
+def _project(item: dict, select: tuple) -> dict:
+    out = {"sys": item["sys"]}
+    for path in select:
+        if path == "sys":
+            continue
+        if path == "fields":
+            out["fields"] = item.get("fields", {})
+            continue
+        top, _, name = path.partition(".")
+        if top == "fields" and name in item.get("fields", {}):
+            out.setdefault("fields", {})[name] = item["fields"][name]
+        elif top == "metadata":
+            out["metadata"] = item.get("metadata")
+    return out
+
+def _linked_asset_ids(item: dict):
+    for value in item.get("fields", {}).values():
+        for link in value if isinstance(value, list) else [value]:
+            if isinstance(link, dict) and link.get("sys", {}).get("linkType") == "Asset":
+                yield link["sys"]["id"]
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Answers /content_types and /entries from a SyntheticSpace, the way the CDA
+    would: skip/limit paging, `order`, `select`, `include`, the [gte]/[lte]/
+    [gt]/[lt] range operators and [exists]. Items are serialized once per `select` so the
+    adapter's own cost stays small; it is measured anyway (server_seconds).
+    """
+
+    def __init__(self, space: SyntheticSpace):
+        super().__init__()
+        self.space = space
+        self.requests = 0
+        self.server_seconds = 0.0
+        self._lock = threading.Lock()
+        self._serialized = {}
+        self._asset_json = {}
+        self._matches = {}
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        url = urlsplit(request.url)
+        query = dict(parse_qsl(url.query))
+        if url.path.endswith("/content_types"):
+            status, body = 200, _dumps(self.space.content_types)
+        elif url.path.endswith("/entries"):
+            status, body = self._entries(query)
+        else:
+            status, body = 404, _dumps({"sys": {"type": "Error", "id": "NotFound"}, "message": url.path})
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK" if status == 200 else "Not Found"
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/vnd.contentful.delivery.v1+json"})
+        response._content = body.encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        with self._lock:
+            self.requests += 1
+            self.server_seconds += time.perf_counter() - started
+        return response
+
+    def close(self):
+        pass
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.server_seconds = 0.0
+
+    def _entries(self, query: dict):
+        items = self.space.entries.get(query.get("content_type"), [])
+        select = tuple(sorted(query["select"].split(","))) if "select" in query else None
+        matches = self._matching(query.get("content_type"), items, query)
+        skip = int(query.get("skip", 0))
+        limit = int(query.get("limit", 100))
+        page = matches[skip:skip + limit]
+
+        serialized = self._items_json(query.get("content_type"), items, select)
+        parts = [
+            '{"sys":{"type":"Array"},"total":%d,"skip":%d,"limit":%d,"items":[' % (len(matches), skip, limit),
+            ",".join(serialized[i] for i in page),
+            "]",
+        ]
+        if int(query.get("include", 1)) > 0:
+            asset_ids = dict.fromkeys(a for i in page for a in _linked_asset_ids(items[i]))
+            assets = [self._asset(a) for a in asset_ids if a in self.space.assets]
+            if assets:
+                parts.append(',"includes":{"Asset":[' + ",".join(assets) + "]}")
+        parts.append("}")
+        return 200, "".join(parts)
+
+    def _matching(self, content_type, items, query) -> list:
+        filters = tuple(sorted(
+            (key, value) for key, value in query.items()
+            if key.startswith(("fields.", "sys.")) and key.endswith(tuple(f"[{op}]" for op in (*_RANGE_OPS, "exists")))
+        ))
+        key = (content_type, filters, query.get("order"))
+        with self._lock:
+            cached = self._matches.get(key)
+        if cached is not None:
+            return cached
+
+        indexes = list(range(len(items)))
+        for name, bound in filters:
+            path, _, op = name[:-1].partition("[")
+            if op == "exists":
+                wanted = bound == "true"
+                indexes = [i for i in indexes if (_lookup(items[i], path) is not None) == wanted]
+                continue
+            bound = _sortable(bound)
+            indexes = [i for i in indexes if _lookup(items[i], path) is not None
+                       and _RANGE_OPS[op](_sortable(_lookup(items[i], path)), bound)]
+        for field in reversed((query.get("order") or "").split(",")):
+            if field:
+                reverse = field.startswith("-")
+                indexes.sort(key=lambda i: _sortable(_lookup(items[i], field.lstrip("-"))), reverse=reverse)
+        with self._lock:
+            self._matches[key] = indexes
+        return indexes
+
+    def _items_json(self, content_type, items, select) -> list:
+        key = (content_type, select)
+        with self._lock:
+            cached = self._serialized.get(key)
+        if cached is None:
+            cached = [_dumps(_project(i, select) if select else i) for i in items]
+            with self._lock:
+                self._serialized[key] = cached
+        return cached
+
+    def _asset(self, asset_id: str) -> str:
+        text = self._asset_json.get(asset_id)
+        if text is None:
+            text = self._asset_json[asset_id] = _dumps(self.space.assets[asset_id])
+        return text
+
+
+# ---------- measuring ----------
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def run_scale(scale: int) -> dict:
+    """Run every stage once at `scale` in this process and return {stage: measurements}."""
+    space = SyntheticSpace(scale)
+    adapter = ReplayAdapter(space)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    results = {}
+    def timed(stage, fn, count):
+        adapter.reset()
+        started = time.perf_counter()
+        value = fn()
+        seconds = time.perf_counter() - started
+        results[stage] = {
+            "seconds": round(seconds, 4),
+            "perSecond": round(count / seconds) if seconds else None,
+            "requests": adapter.requests,
+            "serverSeconds": round(adapter.server_seconds, 4),
+            "peakRssMb": _peak_rss_mb(),
+        }
+        return value
+
+    with contentful.Client(space.space_id, "bench-token", session=session) as client:
+        entries = timed("fetch_all", lambda: events.fetch_all(client), scale)
+        assert len(entries) == scale, f"fetch_all returned {len(entries)} of {scale} entries"
+        timed("build_payload", lambda: events.build_payload(entries), scale)
+        del entries
+
+        entries = timed("fetch_all_gallery_entries", lambda: gallery.fetch_all_gallery_entries(client), scale)
+        assert len(entries) == scale, f"fetch_all_gallery_entries returned {len(entries)} of {scale} entries"
+        timed("build_albums", lambda: gallery.build_albums(entries), scale)
+    return results
+
+def measure(scale: int, repeat: int) -> dict:
+    """Best (fastest) of `repeat` runs, each in a fresh interpreter so RSS is per run."""
+    best = {}
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", str(scale)],
+            check=True, stdout=subprocess.PIPE, text=True,
+        )
+        run = json.loads(proc.stdout.strip().splitlines()[-1])
+        for stage, result in run.items():
+            if stage not in best or result["seconds"] < best[stage]["seconds"]:
+                best[stage] = result
+    return best
+
+
+# ---------- reporting ----------
+
+def _regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    problems = []
+    for scale, stages in results.items():
+        for stage, current in stages.items():
+            previous = baseline.get("scales", {}).get(scale, {}).get(stage)
+            if not previous:
+                continue
+            limit = previous["seconds"] * (1 + tolerance)
+            if current["seconds"] > limit and current["seconds"] - previous["seconds"] > MIN_DELTA_S:
+                problems.append(f"{stage} @ {scale}: {current['seconds']:.3f}s vs baseline {previous['seconds']:.3f}s")
+            if current["peakRssMb"] > previous["peakRssMb"] * (1 + tolerance):
+                problems.append(f"{stage} @ {scale}: {current['peakRssMb']} MB peak RSS vs baseline {previous['peakRssMb']} MB")
+    return problems
+
+def print_report(results: dict, baseline: dict):
+    print(f"{'scale':>8}  {'stage':<27} {'seconds':>9} {'baseline':>9} {'entries/s':>10} {'peak RSS':>10}")
+    for scale, stages in results.items():
+        for stage in STAGES:
+            current = stages[stage]
+            previous = baseline.get("scales", {}).get(scale, {}).get(stage)
+            print(f"{scale:>8}  {stage:<27} {current['seconds']:>9.3f} "
+                  f"{previous['seconds'] if previous else float('nan'):>9.3f} "
+                  f"{current['perSecond'] or 0:>10,} {current['peakRssMb']:>7.1f} MB")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Contentful export pipeline offline.")
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="comma-separated entry counts per content type (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scale; the fastest is kept")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed slowdown / RSS growth over the baseline, as a fraction (default: %(default)s)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.child is not None:
+        print(json.dumps(run_scale(args.child)))
+        return 0
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    results = {str(scale): measure(scale, max(1, args.repeat)) for scale in scales}
+
+    try:
+        with args.baseline.open("r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        baseline = {}
+    print_report(results, baseline)
+
+    if args.update_baseline:
+        merged = dict(baseline.get("scales", {}), **results)
+        with args.baseline.open("w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "scales": dict(sorted(merged.items(), key=lambda kv: int(kv[0]))),
+            }, f, indent=2)
+            f.write("\n")
+        print(f"\nWrote {args.baseline}")
+        return 0
+
+    problems = _regressions(results, baseline, args.tolerance)
+    if problems:
+        print("\nRegressions (tolerance {:.0%}):".format(args.tolerance))
+        for problem in problems:
+            print("  " + problem)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
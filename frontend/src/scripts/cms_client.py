@@ -0,0 +1,89 @@
+# frontend/src/scripts/cms_client.py
+"""
+Shared Contentful configuration for the exporters.
+
+Importing this loads .env once; make_client() builds the single
+contentful.Client that events.py, gallery.py and export.py share.
+"""
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+import contentful
+from contentful.content_type_cache import ContentTypeCache
+
+load_dotenv()
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """
+    On/off switch from the environment: 1/true/yes turn it on, 0/false/no turn it
+    off (any case); unset, empty or anything else leaves `default`.
+    """
+    value = os.getenv(name, "").strip().lower()
+    if value in ("1", "true", "yes"):
+        return True
+    if value in ("0", "false", "no"):
+        return False
+    return default
+
+
+SPACE_ID = os.getenv("CONTENTFUL_SPACE_ID")
+DELIVERY_TOKEN = os.getenv("CONTENTFUL_DELIVERY_TOKEN")
+ENVIRONMENT = os.getenv("CONTENTFUL_ENV", "master")
+
+# frontend/ (this file lives in frontend/src/scripts/)
+PROJECT_FRONTEND = Path(__file__).resolve().parents[2]
+
+# Set CONTENTFUL_INCREMENTAL=1 to sync deltas into a local snapshot instead of re-fetching everything
+INCREMENTAL = env_flag("CONTENTFUL_INCREMENTAL")
+SYNC_DIR = Path(os.getenv("CONTENTFUL_SYNC_DIR", PROJECT_FRONTEND / ".cache" / "contentful"))
+# Set CONTENTFUL_HTTP_CACHE_DIR to keep CDA responses on disk and revalidate them with ETags
+HTTP_CACHE_DIR = os.getenv("CONTENTFUL_HTTP_CACHE_DIR")
+HTTP_CACHE_MB = int(os.getenv("CONTENTFUL_HTTP_CACHE_MB", "100"))
+# Set CONTENTFUL_RAW_MODE=1 to skip SDK resource hydration for full exports (see raw_entries.py)
+RAW_MODE = env_flag("CONTENTFUL_RAW_MODE")
+# Set CONTENTFUL_LAZY_FIELDS=1 to coerce SDK entry/asset fields only when they are read
+LAZY_FIELDS = env_flag("CONTENTFUL_LAZY_FIELDS")
+# Link depth for exporter queries (CDA allows 0-10); the gallery needs >= 1 to get its assets
+INCLUDE_DEPTH = int(os.getenv("CONTENTFUL_INCLUDE", "1"))
+# Set EXPORT_JSON_COMPACT=1 to write public/*.json without indentation
+JSON_INDENT = None if env_flag("EXPORT_JSON_COMPACT") else 2
+
+
+def make_client(raw_mode: bool = RAW_MODE) -> contentful.Client:
+    """
+    Build the delivery client (this also caches content types, one round-trip).
+    raw_mode makes entries() return plain responses for the raw_entries fast path;
+    the incremental Sync API path needs SDK objects, so it always gets a regular client.
+    """
+    if not SPACE_ID or not DELIVERY_TOKEN:
+        raise SystemExit("Missing CONTENTFUL_SPACE_ID or CONTENTFUL_DELIVERY_TOKEN in environment.")
+
+    http_cache = None
+    if HTTP_CACHE_DIR:
+        http_cache = contentful.HTTPCache(HTTP_CACHE_DIR, max_size=HTTP_CACHE_MB * 1024 * 1024)
+
+    # Resolve links = True (default) so that fields like media/photos become Asset objects directly.
+    return contentful.Client(
+        SPACE_ID,
+        DELIVERY_TOKEN,
+        environment=ENVIRONMENT,
+        http_cache=http_cache,
+        raw_mode=raw_mode and not INCREMENTAL,
+        lazy_fields=LAZY_FIELDS,
+    )
+
+
+def select_fields(client, content_type_id: str, field_ids) -> list | None:
+    """
+    `select` for an exporter query: sys plus those of `field_ids` the content type
+    actually has. None (fetch whole entries) when the content type isn't cached.
+    """
+    content_type = ContentTypeCache.get(client.space_id, content_type_id)
+    if content_type is None:
+        return None
+    # ContentTypeField.id is snake_cased; the CDA wants the original field ids
+    existing = {field.raw.get("id") for field in content_type.fields}
+    wanted = [f"fields.{field_id}" for field_id in dict.fromkeys(field_ids) if field_id in existing]
+    return ["sys", *wanted] if wanted else None
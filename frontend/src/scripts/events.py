@@ -2,24 +2,50 @@
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "python_modules"))
-import os, json
-from datetime import datetime, timezone
-from dotenv import load_dotenv
-import contentful
+import heapq
+import os
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import count
+from operator import itemgetter
+from dateutil.rrule import rrulestr
+from contentful.content_type_cache import ContentTypeCache
+from cms_client import INCLUDE_DEPTH, INCREMENTAL, JSON_INDENT, PROJECT_FRONTEND, SYNC_DIR, make_client, select_fields
+from json_stream import JsonStreamWriter
+from output_manifest import OutputManifest
+from precompress import ENABLED as PRECOMPRESS, precompress_outputs
+from pagination import fetch_all_pages, iter_all_pages
+from sync_snapshot import load_snapshot, save_snapshot, snapshot_entries, sync_snapshot
 
-load_dotenv()
+# Your content type API ID
+CONTENT_TYPE_ID = "churchEvents"
 
-SPACE_ID = os.getenv("CONTENTFUL_SPACE_ID")
-DELIVERY_TOKEN = os.getenv("CONTENTFUL_DELIVERY_TOKEN")
-ENVIRONMENT = os.getenv("CONTENTFUL_ENV", "master")
+# Write to frontend/public/events.json
+OUTPUT_PATH = PROJECT_FRONTEND / "public" / "events.json"
 
-if not SPACE_ID or not DELIVERY_TOKEN:
-    raise SystemExit("Missing CONTENTFUL_SPACE_ID or CONTENTFUL_DELIVERY_TOKEN.")
+# Optional export window around today, e.g. EVENTS_PAST_DAYS=30 EVENTS_FUTURE_DAYS=365.
+# Unset (the default) exports every event ever created.
+PAST_DAYS = int(os.environ["EVENTS_PAST_DAYS"]) if os.getenv("EVENTS_PAST_DAYS") else None
+FUTURE_DAYS = int(os.environ["EVENTS_FUTURE_DAYS"]) if os.getenv("EVENTS_FUTURE_DAYS") else None
 
-# Your content type API ID
-CONTENT_TYPE_ID = "churchEvents"
+# Logical event field -> candidate field ids, most preferred first
+FIELD_CANDIDATES = {
+    "title": ("title",),
+    "start": ("startTime", "start", "date", "startsAt", "start_time"),
+    "end": ("endTime", "end", "endsAt", "end_time"),
+    "location": ("location",),
+    "description": ("description",),
+    # RFC 5545 rule text, e.g. "FREQ=WEEKLY;BYDAY=SU" (optionally with EXDATE:/RDATE: lines)
+    "recurrence": ("recurrence", "rrule", "recurrenceRule"),
+}
+
+# Without an export window, recurring events are expanded this many days ahead of today
+RECURRENCE_DAYS = int(os.getenv("EVENTS_RECURRENCE_DAYS", "365"))
+# Parsed rules kept around (keyed by rule text and series start)
+RRULE_CACHE_SIZE = 1024
 
-client = contentful.Client(SPACE_ID, DELIVERY_TOKEN, environment=ENVIRONMENT)
+# Sort key for events without a (parseable) start, so they go last
+_MAX_DT = datetime.max.replace(tzinfo=timezone.utc)
 
 # ---------- helpers ----------
 
@@ -41,7 +67,7 @@ def _to_iso(v):
 def _iso_to_dt(s: str) -> datetime:
     """Parse ISO defensively; return max datetime on failure (so bad/missing goes last)."""
     if not s:
-        return datetime.max.replace(tzinfo=timezone.utc)
+        return _MAX_DT
     try:
         if s.endswith("Z"):
             s = s[:-1] + "+00:00"
@@ -53,7 +79,7 @@ def _iso_to_dt(s: str) -> datetime:
                 main = main.split(".")[0]
             return datetime.fromisoformat(main + ("+" + tz if tz else ""))
         except Exception:
-            return datetime.max.replace(tzinfo=timezone.utc)
+            return _MAX_DT
 
 def _fields_dict(entry):
     """Return a plain dict of fields for a Contentful entry (SDK uses a method)."""
@@ -90,72 +116,227 @@ def _get_any(entry, fdict: dict, *ids):
             return fdict.get(snake)
     return None
 
-def _looks_like_datetime(v) -> bool:
-    iso = _to_iso(v)
-    if not iso:
-        return False
+def _content_type_field_ids(entry) -> set | None:
+    """Field ids of the entry's content type from ContentTypeCache, or None if it isn't cached."""
+    sys_obj = getattr(entry, "sys", None) or {}
     try:
-        _iso_to_dt(iso)
-        return True
-    except Exception:
-        return False
+        content_type = ContentTypeCache.get(sys_obj["space"].id, sys_obj["content_type"].id)
+    except (KeyError, AttributeError):
+        return None
+    return {field.id for field in content_type.fields} if content_type is not None else None
+
+def _compile_field_plan(entries) -> dict:
+    """
+    Map each logical field to the concrete field keys it lives under, checked
+    once against the content type instead of per entry. Keys keep the
+    candidate order of FIELD_CANDIDATES (snake first, as _get_any does).
 
-def _auto_pick_datetime_field(fdict: dict):
-    """Pick the first field that looks like a datetime; prefer names containing 'start'."""
-    if not isinstance(fdict, dict):
-        return None, None
-    # Score fields: prefer ones whose key contains 'start'
-    candidates = []
-    for k, v in fdict.items():
-        if _looks_like_datetime(v):
-            score = 0
-            lk = k.lower()
-            if "start" in lk or "begin" in lk:
-                score += 10
-            if "date" in lk or "time" in lk:
-                score += 2
-            candidates.append((score, k, v))
-    if not candidates:
-        return None, None
-    candidates.sort(key=lambda t: (-t[0], t[1]))  # best score first
-    _, key, val = candidates[0]
-    return key, val
+    Without a cached content type the first entry's fields are used instead;
+    since the CDA omits empty fields that list may be incomplete, so entries
+    missing a planned field still get the full _get_any() search.
+    """
+    known = _content_type_field_ids(entries[0]) if entries else None
+    complete = known is not None
+    if not complete:
+        known = set(_fields_dict(entries[0])) if entries else set()
+
+    plan = {}
+    for logical, ids in FIELD_CANDIDATES.items():
+        keys = []
+        for name in ids:
+            for key in (_camel_to_snake(name), name):
+                if key in known and key not in keys:
+                    keys.append(key)
+        plan[logical] = (tuple(keys), None if complete else ids)
+    return plan
+
+def _get_planned(entry, fdict: dict, planned):
+    """One direct lookup per planned key; _get_any() only when the plan may be incomplete."""
+    keys, fallback_ids = planned
+    for key in keys:
+        val = fdict.get(key)
+        if val is not None:
+            return val
+    return _get_any(entry, fdict, *fallback_ids) if fallback_ids else None
 
 # ---------- main logic ----------
 
-def fetch_all():
+def _event_select(client) -> list | None:
+    """`select` for churchEvents queries: only the fields build_events can read stay on the wire."""
+    return select_fields(client, CONTENT_TYPE_ID, (name for ids in FIELD_CANDIDATES.values() for name in ids))
+
+def fetch_all(client, include=INCLUDE_DEPTH):
     """Fetch all entries for churchEvents (no server-side order; we sort locally)."""
-    limit, skip, items = 1000, 0, []
-    while True:
-        page = client.entries({
-            "content_type": CONTENT_TYPE_ID,
-            "include": 1,
-            "limit": limit,
-            "skip": skip,
-        })
-        items += list(page)
-        total = getattr(page, "total", len(page))
-        skip += limit
-        if skip >= total or len(page) == 0:
-            break
-    return items
+    query = {
+        "content_type": CONTENT_TYPE_ID,
+        "include": include,
+    }
+    select = _event_select(client)
+    if select:
+        query["select"] = select
+    return fetch_all_pages(client, query, limit=1000)
 
-def build_payload(entries, debug=False):
-    events = []
+def event_window(past_days=None, future_days=None, today=None):
+    """(since, until) datetimes for a window of whole UTC days around today; None means unbounded."""
+    today = today or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    since = today - timedelta(days=past_days) if past_days is not None else None
+    until = today + timedelta(days=future_days + 1) if future_days is not None else None
+    return since, until
+
+def _cda_field_id(client, logical: str) -> str | None:
+    """CDA id of a logical field (first FIELD_CANDIDATES entry the content type has), if known."""
+    content_type = ContentTypeCache.get(client.space_id, CONTENT_TYPE_ID)
+    if content_type is None:
+        return None
+    existing = {field.raw.get("id") for field in content_type.fields}
+    return next((name for name in FIELD_CANDIDATES[logical] if name in existing), None)
+
+def fetch_window(client, since=None, until=None, include=INCLUDE_DEPTH):
+    """
+    Yield churchEvents whose start falls in [since, until), filtered and ordered
+    by start on the server, page by page (see iter_events()).
+    """
+    start_field = _cda_field_id(client, "start") or FIELD_CANDIDATES["start"][0]
+    recurrence_field = _cda_field_id(client, "recurrence")
+    query = {
+        "content_type": CONTENT_TYPE_ID,
+        "include": include,
+        # sys.id breaks ties so paging over equal start times stays stable
+        "order": f"fields.{start_field},sys.id",
+    }
+    if since is not None:
+        query[f"fields.{start_field}[gte]"] = since.isoformat()
+    if until is not None:
+        query[f"fields.{start_field}[lt]"] = until.isoformat()
+    if recurrence_field:
+        # Series are expanded from fetch_recurring(); their first start may lie outside the window
+        query[f"fields.{recurrence_field}[exists]"] = "false"
+    select = _event_select(client)
+    if select:
+        query["select"] = select
+    return iter_all_pages(client, query, limit=1000)
+
+def fetch_recurring(client, include=INCLUDE_DEPTH) -> list:
+    """Fetch every churchEvents entry that has a recurrence rule (none if the content type has no such field)."""
+    recurrence_field = _cda_field_id(client, "recurrence")
+    if not recurrence_field:
+        return []
+    query = {
+        "content_type": CONTENT_TYPE_ID,
+        "include": include,
+        f"fields.{recurrence_field}[exists]": "true",
+    }
+    select = _event_select(client)
+    if select:
+        query["select"] = select
+    return fetch_all_pages(client, query, limit=1000)
+
+def fetch_incremental(client):
+    """Apply Sync API deltas to the on-disk snapshot and return its entries."""
+    path = SYNC_DIR / "events.sync.json"
+    snapshot = load_snapshot(path, client, CONTENT_TYPE_ID)
+    changed = sync_snapshot(client, snapshot)
+    save_snapshot(path, snapshot)
+    print(f"Synced {changed} change(s) into {path}")
+    return snapshot_entries(client, snapshot)
+
+def _as_dt(raw, iso: str):
+    """datetime for a date value; SDK-parsed datetimes are reused, only strings go through _iso_to_dt."""
+    if isinstance(raw, datetime):
+        return raw.replace(tzinfo=raw.tzinfo or timezone.utc)
+    return _iso_to_dt(iso) if iso else None
+
+@lru_cache(maxsize=RRULE_CACHE_SIZE)
+def _parse_rule(rule: str, dtstart: datetime):
+    """Parsed rrule/rruleset, or None when the text isn't a valid rule for this start."""
+    try:
+        # No cache=True: a cached rule that raises mid-iteration (naive vs aware
+        # values) keeps its internal lock and would block the next between()
+        return rrulestr(rule, dtstart=dtstart, forceset=True)
+    except (ValueError, TypeError):
+        return None
+
+def _expand_rule(rule: str, start_dt: datetime, after: datetime, before: datetime) -> list | None:
+    """
+    Occurrence starts (aware) of `rule` within [after, before), or None when
+    it can't be expanded. Rules are expanded in the series' naive wall-clock
+    time, which is what floating DTSTART/EXDATE/UNTIL values in the text (and
+    BYDAY/BYHOUR) refer to; rules that only work with an aware start
+    (UNTIL=...Z, TZID=...) get a second try.
+    """
+    tz = start_dt.tzinfo
+
+    def wall(dt):
+        return dt.astimezone(tz).replace(tzinfo=None)
+
+    for dtstart in (wall(start_dt), start_dt):
+        parsed = _parse_rule(rule, dtstart)
+        if parsed is None:
+            continue
+        lo, hi = (after, before) if dtstart.tzinfo else (wall(after), wall(before))
+        try:
+            found = [occ for occ in parsed.between(lo, hi, inc=True) if occ < hi]
+        except (ValueError, TypeError):  # e.g. naive and aware values mixed in the rule text
+            continue
+        return [occ if occ.tzinfo else occ.replace(tzinfo=tz) for occ in found]
+    return None
+
+def _occurrences(rule, start_dt: datetime, end_dt, ev: dict, since=None, until=None):
+    """
+    Iterator of (start, event) per occurrence of a recurring event within
+    [since, until), or None if the rule can't be expanded. Bounds default to
+    the series start and RECURRENCE_DAYS ahead of today, so rule iteration is
+    always bounded.
+    """
+    if not isinstance(rule, str) or not rule.strip():
+        return None
+    # Naive start times are taken as UTC, as _to_iso does
+    start_dt = start_dt if start_dt.tzinfo else start_dt.replace(tzinfo=timezone.utc)
+    after = since if since is not None and since > start_dt else start_dt
+    before = until if until is not None else event_window(future_days=RECURRENCE_DAYS)[1]
+    found = _expand_rule(rule.strip(), start_dt, after, before)
+    if found is None:
+        return None
+    duration = end_dt - start_dt if end_dt and end_dt.tzinfo and end_dt >= start_dt else None
+
+    def expand():
+        for occ in found:
+            occ = occ.astimezone(start_dt.tzinfo)  # back to the series' own offset
+            yield occ, {
+                **ev,
+                "id": f"{ev['id']}-{occ.strftime('%Y%m%dT%H%M')}",
+                "seriesId": ev["id"],
+                "start": _to_iso(occ),
+                "startMonth": occ.strftime("%B"),
+                "startDay": occ.day,
+                "startYear": occ.year,
+                "end": _to_iso(occ + duration) if duration is not None else None,
+            }
+    return expand()
+
+def _event_records(entries, debug=False, since=None, until=None):
+    """
+    Yield (start datetime, event dict) per entry, in input order. Recurring
+    entries yield one record per occurrence within [since, until) instead.
+    """
+    plan = None
     for e in entries:
+        if plan is None:
+            plan = _compile_field_plan([e])
         f = _fields_dict(e)
 
-        title = _get_any(e, f, "title") or ""
-        start_raw = _get_any(e, f, "startTime", "start", "date", "startsAt", "start_time")
-        end_raw   = _get_any(e, f, "endTime", "end", "endsAt", "end_time")
-        location  = _get_any(e, f, "location") or ""
-        description = _get_any(e, f, "description") or ""
+        title = _get_planned(e, f, plan["title"]) or ""
+        start_raw = _get_planned(e, f, plan["start"])
+        end_raw   = _get_planned(e, f, plan["end"])
+        location  = _get_planned(e, f, plan["location"]) or ""
+        description = _get_planned(e, f, plan["description"]) or ""
 
         sys_obj = getattr(e, "sys", {}) or {}
 
-        # Parse start into month/day/year
+        # Parse start into month/day/year. Date fields arrive as datetimes already
+        # (the SDK parsed them), so only plain strings go through _iso_to_dt.
         start_iso = _to_iso(start_raw)
-        start_dt = _iso_to_dt(start_iso) if start_iso else None
+        start_dt = _as_dt(start_raw, start_iso)
 
         ev = {
             "id": sys_obj.get("id"),
@@ -168,15 +349,79 @@ def build_payload(entries, debug=False):
             "location": _to_iso(location) if isinstance(location, dict) else (location or ""),
             "description": _to_iso(description) if isinstance(description, dict) else (description or ""),
         }
-        events.append(ev)
 
         if debug:
             print("\n[debug] Entry sys.id:", ev["id"])
             print("[debug] start ISO:", ev["start"])
             print("[debug] month/day/year:", ev["startMonth"], ev["startDay"], ev["startYear"])
 
-    events.sort(key=lambda ev: _iso_to_dt(ev.get("start", "")))
+        rule = _get_planned(e, f, plan["recurrence"])
+        occurrences = None
+        if rule and start_dt is not None and start_dt is not _MAX_DT:
+            end_dt = _as_dt(end_raw, _to_iso(end_raw)) if end_raw else None
+            occurrences = _occurrences(rule, start_dt, end_dt, ev, since=since, until=until)
+        if occurrences is not None:
+            yield from occurrences
+        else:
+            yield start_dt or _MAX_DT, ev
+
+def _within(start_dt: datetime, since, until) -> bool:
+    if start_dt is _MAX_DT:
+        return False
+    # Naive start times are taken as UTC, as _to_iso does
+    start_dt = start_dt if start_dt.tzinfo else start_dt.replace(tzinfo=timezone.utc)
+    return (since is None or start_dt >= since) and (until is None or start_dt < until)
+
+def build_events(entries, debug=False, since=None, until=None) -> list:
+    """Transform entries into event dicts, sorted by start time (optionally only those in [since, until))."""
+    # (start datetime, event) pairs: each start is parsed once and the sort reuses it
+    decorated = list(_event_records(entries, debug=debug, since=since, until=until))
+    if since is not None or until is not None:
+        decorated = [rec for rec in decorated if _within(rec[0], since, until)]
+    decorated.sort(key=itemgetter(0))
+    return [ev for _, ev in decorated]
 
+def _in_start_order(records):
+    """
+    Records of entries ordered by start (fetch_window), with occurrences of
+    recurring entries among them held back until the stream reaches their
+    start. That happens when fetch_window can't leave series out (content
+    type not cached); every occurrence starts at or after its entry, so the
+    output stays sorted.
+    """
+    pending, tiebreak = [], count()
+    for rec in records:
+        if "seriesId" in rec[1]:
+            heapq.heappush(pending, (rec[0], next(tiebreak), rec[1]))
+            continue
+        while pending and pending[0][0] <= rec[0]:
+            start_dt, _, ev = heapq.heappop(pending)
+            yield start_dt, ev
+        yield rec
+    while pending:
+        start_dt, _, ev = heapq.heappop(pending)
+        yield start_dt, ev
+
+def iter_events(entries, debug=False, recurring=(), since=None, until=None):
+    """
+    Transform entries already ordered by start (fetch_window) one at a time; no
+    global sort. Occurrences of the `recurring` entries (fetch_recurring) within
+    [since, until) are sorted on their own and merged into that stream.
+    """
+    # Entries whose rule doesn't parse come back as single events, possibly outside the window
+    occurrences = sorted(
+        (rec for rec in _event_records(recurring, since=since, until=until) if _within(rec[0], since, until)),
+        key=itemgetter(0),
+    )
+    stream = _in_start_order(
+        rec for rec in _event_records(entries, debug=debug, since=since, until=until)
+        if _within(rec[0], since, until)
+    )
+    records = heapq.merge(stream, occurrences, key=itemgetter(0))
+    return (ev for _, ev in records)
+
+def build_payload(entries, debug=False):
+    events = build_events(entries, debug=debug)
     return {
         "events": events,
         "totalItems": len(events),
@@ -184,18 +429,36 @@ def build_payload(entries, debug=False):
     }
 
 
+def export_events(client, debug=False, indent=JSON_INDENT, manifest=None,
+                  past_days=PAST_DAYS, future_days=FUTURE_DAYS):
+    """Fetch, transform and stream events.json to disk; return the number of events written."""
+    since, until = event_window(past_days, future_days)
+    if INCREMENTAL:
+        # The snapshot holds everything; the window (if any) is applied locally
+        events = build_events(fetch_incremental(client), debug=debug, since=since, until=until)
+    elif since is not None or until is not None:
+        events = iter_events(fetch_window(client, since, until), debug=debug,
+                             recurring=fetch_recurring(client), since=since, until=until)
+    else:
+        events = build_events(fetch_all(client), debug=debug)
 
-if __name__ == "__main__":
-    entries = fetch_all()
-    data = build_payload(entries, debug=True)
+    # generatedAt changes every run, so it doesn't count towards "the data changed"
+    with JsonStreamWriter(OUTPUT_PATH, indent=indent, manifest=manifest, volatile=("generatedAt",)) as out:
+        total = out.write_list("events", events)
+        out.write_value("totalItems", total)
+        out.write_value("generatedAt", datetime.now(timezone.utc).isoformat())
 
-    # You are running from: frontend/src/scripts/events.py
-    # Write to frontend/public/events.json
-    PROJECT_FRONTEND = Path(__file__).resolve().parents[2]
-    out_path = PROJECT_FRONTEND / "public" / "events.json"
+    if out.skipped:
+        print(f"\n{OUTPUT_PATH} unchanged ({total} events), left as is")
+    else:
+        print(f"\nWrote {OUTPUT_PATH} with {total} events")
+    return total
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
 
-    print(f"\nWrote {out_path} with {data['totalItems']} events")
+if __name__ == "__main__":
+    manifest = OutputManifest.load()
+    with make_client() as client:
+        export_events(client, debug=True, manifest=manifest)
+    if PRECOMPRESS:
+        precompress_outputs(manifest)
+    manifest.save()
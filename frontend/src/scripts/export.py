@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# frontend/src/scripts/export.py
+"""
+Single entry point for the prebuild export.
+
+    python3 src/scripts/export.py --all        # events.json + albums.json
+    python3 src/scripts/export.py events       # just one of them
+
+All exporters share one contentful.Client (one .env load, one
+content-type cache round-trip, one keep-alive connection pool) and run
+concurrently.
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "python_modules"))
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from cms_client import JSON_INDENT, RAW_MODE, make_client
+from events import FUTURE_DAYS, PAST_DAYS, export_events
+from gallery import MONOLITHIC, export_gallery
+from output_manifest import OutputManifest
+from precompress import ENABLED as PRECOMPRESS, precompress_outputs
+
+EXPORTERS = {
+    "events": export_events,
+    "gallery": export_gallery,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export Contentful content to frontend/public.")
+    parser.add_argument("targets", nargs="*", metavar="target",
+                        help="exporter(s) to run: " + ", ".join(EXPORTERS))
+    parser.add_argument("--all", action="store_true", help="run every exporter")
+    parser.add_argument("--compact", action="store_true",
+                        help="write JSON without indentation (default: EXPORT_JSON_COMPACT)")
+    parser.add_argument("--monolithic", action="store_true",
+                        help="also write the single public/albums.json (default: ALBUMS_MONOLITHIC)")
+    parser.add_argument("--past-days", type=int, default=PAST_DAYS, metavar="N",
+                        help="only export events that started at most N days ago (default: EVENTS_PAST_DAYS)")
+    parser.add_argument("--future-days", type=int, default=FUTURE_DAYS, metavar="N",
+                        help="only export events starting within the next N days (default: EVENTS_FUTURE_DAYS)")
+    parser.add_argument("--raw", action="store_true",
+                        help="build plain objects from the CDA JSON instead of SDK resources "
+                             "(default: CONTENTFUL_RAW_MODE)")
+    args = parser.parse_args(argv)
+    unknown = [t for t in args.targets if t not in EXPORTERS]
+    if unknown:
+        parser.error("unknown target(s): " + ", ".join(unknown))
+    if args.all or not args.targets:
+        args.targets = list(EXPORTERS)
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    targets = list(dict.fromkeys(args.targets))
+    indent = None if args.compact else JSON_INDENT
+    manifest = OutputManifest.load()
+    options = {
+        "events": {"indent": indent, "manifest": manifest,
+                   "past_days": args.past_days, "future_days": args.future_days},
+        "gallery": {"indent": indent, "monolithic": args.monolithic or MONOLITHIC, "manifest": manifest},
+    }
+
+    with make_client(raw_mode=args.raw or RAW_MODE) as client, ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        futures = [pool.submit(EXPORTERS[name], client, **options[name]) for name in targets]
+        # .result() re-raises the first failure so the build still stops on errors
+        for future in futures:
+            future.result()
+    if PRECOMPRESS:
+        print(f"Precompressed {precompress_outputs(manifest)} file(s)")
+    manifest.save()
+
+if __name__ == "__main__":
+    main()
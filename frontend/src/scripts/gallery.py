@@ -4,31 +4,36 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "python_modules"))
 
 import os
-import json
+import re
 from collections import defaultdict
-from dotenv import load_dotenv
-import contentful
+from cms_client import INCLUDE_DEPTH, INCREMENTAL, JSON_INDENT, PROJECT_FRONTEND, SYNC_DIR, env_flag, make_client, select_fields
+from json_stream import JsonStreamWriter
+from output_manifest import OutputManifest
+from precompress import ENABLED as PRECOMPRESS, precompress_outputs
+from pagination import fetch_all_pages
+from placeholders import ENABLED as PLACEHOLDERS, fetch_placeholders
+from search_index import write_search_index
+from sync_snapshot import load_snapshot, save_snapshot, snapshot_entries, sync_snapshot
 
 # ---------------------------
 # Config / Environment
 # ---------------------------
-load_dotenv()
-
-SPACE_ID = os.getenv("CONTENTFUL_SPACE_ID")
-DELIVERY_TOKEN = os.getenv("CONTENTFUL_DELIVERY_TOKEN")
-ENVIRONMENT = os.getenv("CONTENTFUL_ENV", "master")
 CONTENT_TYPE_ID = os.getenv("CONTENTFUL_GALLERY_CT", "gallery")  # change if your CT id differs
 OUTPUT_PATH = os.getenv("ALBUMS_JSON_PATH", "public/albums.json")
-
-if not SPACE_ID or not DELIVERY_TOKEN:
-    raise SystemExit("Missing CONTENTFUL_SPACE_ID or DELIVERY_TOKEN in environment.")
-
-# Resolve links = True (default) so that fields like media/photos become Asset objects directly.
-client = contentful.Client(
-    SPACE_ID,
-    DELIVERY_TOKEN,
-    environment=ENVIRONMENT,
-)
+# Sharded output read by the frontend: <dir>/index.json + <dir>/<slug>.json per album
+ALBUMS_DIR = os.getenv("ALBUMS_DIR", "public/albums")
+# Set ALBUMS_MONOLITHIC=1 to also write the single albums.json file
+MONOLITHIC = env_flag("ALBUMS_MONOLITHIC")
+# Files in ALBUMS_DIR that are not album shards
+RESERVED_SHARD_NAMES = ("index", "search")
+# Images API widths offered in each asset's srcset (never above the stored width)
+IMAGE_WIDTHS = tuple(int(w) for w in os.getenv("GALLERY_IMAGE_WIDTHS", "320,640,960,1280,1920").split(",") if w.strip())
+IMAGE_FORMAT = os.getenv("GALLERY_IMAGE_FORMAT", "webp")
+IMAGE_QUALITY = int(os.getenv("GALLERY_IMAGE_QUALITY", "75"))
+# The Images API can't re-encode these without losing something (vector data, animation)
+_NO_VARIANTS = ("image/svg+xml", "image/gif")
+# Fields iter_albums reads; the rest of each gallery entry is not requested
+GALLERY_FIELDS = ("category", "title", "media", "photos")
 
 # ---------------------------
 # Helpers
@@ -42,6 +47,14 @@ def _https_url(url: str | None) -> str | None:
         return "https:" + url
     return url
 
+def slugify(name: str) -> str:
+    """
+    URL slug for an album name. The frontend no longer derives slugs itself;
+    it reads `slug` from albums/index.json and the album shards.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", (name or "").lower().strip())
+    return re.sub(r"(^-|-$)+", "", slug)
+
 def asset_info(asset) -> dict | None:
     """
     Return a compact dict for an Asset (or None if missing).
@@ -54,16 +67,22 @@ def asset_info(asset) -> dict | None:
     title = getattr(asset, "title", None) or getattr(asset, "fields", {}).get("title")
     url = _https_url(getattr(asset, "url", lambda: None)()) if callable(getattr(asset, "url", None)) else _https_url(getattr(asset, "url", None))
 
-    # Details (width/height) live under file -> details -> image
+    # Details (width/height) live under file -> details -> image.
+    # The SDK keeps Asset.file as the raw CDA dict (camelCase keys).
     file_obj = getattr(asset, "file", None)
     file_name = None
     content_type = None
     width = None
     height = None
     if file_obj:
-        file_name = getattr(file_obj, "file_name", None)
-        content_type = getattr(file_obj, "content_type", None)
-        details = getattr(file_obj, "details", None)
+        if isinstance(file_obj, dict):
+            file_name = file_obj.get("fileName")
+            content_type = file_obj.get("contentType")
+            details = file_obj.get("details")
+        else:
+            file_name = getattr(file_obj, "file_name", None)
+            content_type = getattr(file_obj, "content_type", None)
+            details = getattr(file_obj, "details", None)
         if isinstance(details, dict):
             img = details.get("image")
             if isinstance(img, dict):
@@ -78,73 +97,89 @@ def asset_info(asset) -> dict | None:
         "contentType": content_type,
         "width": width,
         "height": height,
+        "srcset": image_srcset(asset, content_type, width),
     }
 
-def photos_list(assets) -> list:
+def image_srcset(asset, content_type: str | None, width) -> str | None:
     """
-    Convert a list (or None) of Asset objects/links to a list of URLs.
+    `srcset` of Images API variants (IMAGE_WIDTHS, re-encoded to IMAGE_FORMAT)
+    for an image asset, built with Asset.url(**params). Widths above the
+    stored width are left out so nothing is upscaled; None when the asset
+    isn't an image, its width is unknown or it has no URL.
+    """
+    if not content_type or not content_type.startswith("image/") or content_type in _NO_VARIANTS:
+        return None
+    if not isinstance(width, int) or width <= 0 or not callable(getattr(asset, "url", None)):
+        return None
+    widths = [w for w in IMAGE_WIDTHS if w <= width] or [width]
+    variants = []
+    for w in widths:
+        url = _https_url(asset.url(w=w, fm=IMAGE_FORMAT, q=IMAGE_QUALITY))
+        if not url:
+            return None
+        variants.append(f"{url} {w}w")
+    return ", ".join(variants)
+
+def asset_infos(assets, cache: dict | None = None) -> list:
+    """
+    asset_info() for each Asset in a list (or None), skipping missing ones.
+    Results are memoized by asset id in `cache`; pass the same dict for every
+    entry of an export, since one photo is often reused across many albums.
     """
     if not assets:
         return []
-    urls = []
+    if cache is None:
+        cache = {}
+    infos = []
     for a in assets:
-        info = asset_info(a)
-        if info and info["url"]:
-            urls.append(info["url"])
-    return urls
+        if a is None:
+            continue
+        a_id = getattr(a, "id", None)
+        info = cache.get(a_id) if a_id else None
+        if info is None:
+            info = asset_info(a)
+            # Only cache resolved assets; an unresolved link to the same id has no URL
+            if a_id and info["url"]:
+                cache[a_id] = info
+        infos.append(info)
+    return infos
 
 # ---------------------------
 # Fetch all Gallery entries (paginate)
 # ---------------------------
-def fetch_all_gallery_entries() -> list:
-    entries = []
-    limit = 100
-    skip = 0
-    while True:
-        page = client.entries(
-            {
-                "content_type": CONTENT_TYPE_ID,
-                "limit": limit,
-                "skip": skip,
-                "order": "sys.createdAt",  # oldest → newest (change to -sys.createdAt for reverse)
-            }
-        )
-        batch = list(page)
-        entries.extend(batch)
-        if len(batch) < limit:
-            break
-        skip += limit
-    return entries
+def fetch_all_gallery_entries(client, include=INCLUDE_DEPTH) -> list:
+    query = {
+        "content_type": CONTENT_TYPE_ID,
+        "order": "sys.createdAt",  # oldest → newest (change to -sys.createdAt for reverse)
+        "include": include,
+    }
+    select = select_fields(client, CONTENT_TYPE_ID, GALLERY_FIELDS)
+    if select:
+        query["select"] = select
+    return fetch_all_pages(client, query, limit=100)
+
+def fetch_incremental_gallery_entries(client) -> list:
+    """
+    Apply Sync API deltas (entries and assets) to the on-disk snapshot and return its entries.
+    """
+    path = SYNC_DIR / "gallery.sync.json"
+    snapshot = load_snapshot(path, client, CONTENT_TYPE_ID, with_assets=True)
+    changed = sync_snapshot(client, snapshot)
+    save_snapshot(path, snapshot)
+    print(f"Synced {changed} change(s) into {path}")
+    return snapshot_entries(client, snapshot)
 
 # ---------------------------
 # Transform → albums.json structure
 # ---------------------------
-def build_albums(entries: list) -> dict:
+def iter_albums(entries: list):
     """
-    Build:
-    {
-      "albums": [
-        {
-          "name": "<category>",
-          "count": <number_of_items>,
-          "items": [
-            {
-              "id": "<entry_id>",
-              "title": "<category or entry title>",
-              "album": "<category>",
-              "cover": "<cover_url_or_null>",
-              "photos": ["<url>", ...],
-              "assets": [ {id, title, url, ...}, ... ]  # optional rich objects for your UI
-            }
-          ]
-        },
-        ...
-      ],
-      "totalItems": <total_entry_count>,
-      "albumCount": <distinct_categories>
-    }
+    Group entries by category and yield album dicts one at a time,
+    sorted by name (items sorted by title), for streaming writers.
     """
     by_category = defaultdict(list)
+    # asset id -> asset_info(), shared by every entry so a reused photo is normalized once
+    infos_by_id = {}
 
     for e in entries:
         # Safe field access. With resolve_links=True, media/photos should be Asset objects.
@@ -157,12 +192,12 @@ def build_albums(entries: list) -> dict:
         media_asset = fields.get("media")  # Asset or None
         cover = None
         if media_asset:
-            info = asset_info(media_asset)
-            cover = info["url"] if info else None
+            cover = asset_infos([media_asset], infos_by_id)[0]["url"]
 
+        # One pass per photo: both the URL list and the rich objects come from the same infos
         photos_assets = fields.get("photos")  # list[Asset] or None
-        photo_urls = photos_list(photos_assets)
-        photo_infos = [asset_info(a) for a in (photos_assets or []) if asset_info(a)]
+        photo_infos = asset_infos(photos_assets, infos_by_id)
+        photo_urls = [info["url"] for info in photo_infos if info["url"]]
 
         by_category[category].append(
             {
@@ -175,21 +210,41 @@ def build_albums(entries: list) -> dict:
             }
         )
 
-    albums = []
-    for cat, items in by_category.items():
-        albums.append(
-            {
-                "name": cat,
-                "count": len(items),
-                "items": items,
-            }
-        )
-
     # Sort albums alphabetically; sort items by title for stable output
-    albums.sort(key=lambda a: a["name"].lower())
-    for a in albums:
-        a["items"].sort(key=lambda i: (i["title"] or "").lower())
+    for cat, items in sorted(by_category.items(), key=lambda kv: kv[0].lower()):
+        items.sort(key=lambda i: (i["title"] or "").lower())
+        yield {
+            "name": cat,
+            "count": len(items),
+            "items": items,
+        }
 
+def build_albums(entries: list) -> dict:
+    """
+    Build:
+    {
+      "albums": [
+        {
+          "name": "<category>",
+          "count": <number_of_items>,
+          "items": [
+            {
+              "id": "<entry_id>",
+              "title": "<category or entry title>",
+              "album": "<category>",
+              "cover": "<cover_url_or_null>",
+              "photos": ["<url>", ...],
+              "assets": [ {id, title, url, ...}, ... ]  # optional rich objects for your UI
+            }
+          ]
+        },
+        ...
+      ],
+      "totalItems": <total_entry_count>,
+      "albumCount": <distinct_categories>
+    }
+    """
+    albums = list(iter_albums(entries))
     return {
         "albums": albums,
         "totalItems": sum(a["count"] for a in albums),
@@ -199,21 +254,143 @@ def build_albums(entries: list) -> dict:
 # ---------------------------
 # Main
 # ---------------------------
-def main():
-    entries = fetch_all_gallery_entries()
-    data = build_albums(entries)
+def album_cover(album: dict) -> str | None:
+    """Banner image of an album: its first item's cover, else that item's first photo."""
+    first = album["items"][0] if album["items"] else {}
+    return first.get("cover") or (first.get("photos") or [None])[0]
+
+def album_summary(album: dict, slug: str, placeholders: dict | None = None) -> dict:
+    """
+    Small per-album record for albums/index.json (enough to render the banner list).
+    With placeholders ({cover url: {color, preview}}) the cover's one is included.
+    """
+    cover = album_cover(album)
+    summary = {
+        "name": album["name"],
+        "slug": slug,
+        "count": album["count"],
+        "cover": cover,
+    }
+    if placeholders is not None:
+        summary["placeholder"] = placeholders.get(cover)
+    return summary
+
+def slugged_albums(albums):
+    """
+    Yield (slug, album) pairs. Two categories can slugify the same way
+    ("VBS" / "VBS!"), so later ones get -2, -3, ... to keep both reachable.
+    """
+    taken = set(RESERVED_SHARD_NAMES)
+    for album in albums:
+        base = slugify(album["name"]) or "album"
+        slug, n = base, 2
+        while slug in taken:
+            slug, n = f"{base}-{n}", n + 1
+        taken.add(slug)
+        yield slug, album
+
+def write_album_shards(albums, out_dir: Path, indent=JSON_INDENT, manifest=None,
+                       placeholders=None) -> tuple[int, int]:
+    """
+    Write one <slug>.json per album plus index.json; remove shards of albums that disappeared.
+    Returns (album_count, total_items).
+    """
+    index, written = [], set(RESERVED_SHARD_NAMES)
+    total_items = 0
+    for slug, album in slugged_albums(albums):
+        written.add(slug)
+
+        with JsonStreamWriter(out_dir / f"{slug}.json", indent=indent, manifest=manifest) as out:
+            out.write_value("name", album["name"])
+            out.write_value("slug", slug)
+            out.write_value("count", album["count"])
+            out.write_list("items", album["items"])
+
+        index.append(album_summary(album, slug, placeholders))
+        total_items += album["count"]
+
+    with JsonStreamWriter(out_dir / "index.json", indent=indent, manifest=manifest) as out:
+        out.write_list("albums", index)
+        out.write_value("totalItems", total_items)
+        out.write_value("albumCount", len(index))
 
-    # Always write into project root / public/albums.json (or env override)
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    output_rel = OUTPUT_PATH  # e.g. "public/albums.json"
-    out_path = PROJECT_ROOT / output_rel
+    for stale in out_dir.glob("*.json"):
+        if stale.stem not in written:
+            stale.unlink()
+            if manifest is not None:
+                manifest.forget(stale)
+    return len(index), total_items
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+def write_albums_json(albums, out_path: Path, indent=JSON_INDENT, manifest=None) -> tuple[int, int]:
+    """
+    Write the monolithic albums.json. Returns (album_count, total_items).
+    """
+    total_items = 0
+    def counted(albums):
+        nonlocal total_items
+        for album in albums:
+            total_items += album["count"]
+            yield album
+
+    with JsonStreamWriter(out_path, indent=indent, manifest=manifest) as out:
+        album_count = out.write_list("albums", counted(albums))
+        out.write_value("totalItems", total_items)
+        out.write_value("albumCount", album_count)
+    return album_count, total_items
+
+def remove_albums_json(out_path: Path, manifest=None):
+    """
+    Delete an albums.json (and its .gz/.br) left over from a monolithic run,
+    so a stale copy isn't deployed next to the shards.
+    """
+    for path in (out_path, *(out_path.with_name(out_path.name + ext) for ext in (".gz", ".br"))):
+        if path.exists():
+            path.unlink()
+            print(f"Removed stale {path}")
+        if manifest is not None:
+            manifest.forget(path)
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def export_gallery(client, indent=JSON_INDENT, monolithic=MONOLITHIC, manifest=None,
+                   placeholders=PLACEHOLDERS) -> int:
+    """
+    Fetch, transform and write albums/index.json + one shard per album + the
+    search.json token index (and albums.json when monolithic); return the
+    number of albums written.
+    """
+    if INCREMENTAL:
+        entries = fetch_incremental_gallery_entries(client)
+    else:
+        entries = fetch_all_gallery_entries(client)
+    albums = list(iter_albums(entries))
+
+    cover_placeholders = None
+    if placeholders:
+        cover_placeholders = fetch_placeholders(album_cover(a) for a in albums)
+        print(f"Placeholders for {len(cover_placeholders)} album cover(s).")
 
-    print(f"Wrote {out_path} with {data['albumCount']} album(s), {data['totalItems']} item(s).")
+    # Always write into project root / public/... (or env override)
+    out_dir = PROJECT_FRONTEND / ALBUMS_DIR
+    album_count, total_items = write_album_shards(albums, out_dir, indent=indent, manifest=manifest,
+                                                  placeholders=cover_placeholders)
+    print(f"Wrote {out_dir}/ with {album_count} album shard(s), {total_items} item(s).")
+    token_count = write_search_index(slugged_albums(albums), out_dir / "search.json", manifest=manifest)
+    print(f"Wrote {out_dir / 'search.json'} with {token_count} token(s).")
+
+    out_path = PROJECT_FRONTEND / OUTPUT_PATH  # e.g. "public/albums.json"
+    if monolithic:
+        write_albums_json(albums, out_path, indent=indent, manifest=manifest)
+        print(f"Wrote {out_path} with {album_count} album(s), {total_items} item(s).")
+    else:
+        remove_albums_json(out_path, manifest=manifest)
+    return album_count
+
+def main():
+    manifest = OutputManifest.load()
+    with make_client() as client:
+        export_gallery(client, manifest=manifest)
+    if PRECOMPRESS:
+        precompress_outputs(manifest)
+    manifest.save()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,109 @@
+# frontend/src/scripts/json_stream.py
+"""
+Streaming writer for the exporters' top-level JSON objects.
+
+Lists are serialized one element at a time as they come out of a
+generator, so the full payload never has to exist as one dict (or one
+big string). Output goes to a temp file next to the target and is
+renamed into place only once complete, so the site never serves a
+half-written file.
+
+With indent=2 the bytes match json.dump(..., ensure_ascii=False, indent=2);
+indent=None writes compact JSON with no whitespace.
+
+Given an OutputManifest, the writer also hashes its output (minus the
+`volatile` members) and leaves the existing file untouched when that
+hash hasn't changed since the last export.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+class JsonStreamWriter:
+    """
+    Usage:
+        with JsonStreamWriter(path, indent=2) as out:
+            count = out.write_list("events", iter_events(entries))
+            out.write_value("totalItems", count)
+    """
+
+    def __init__(self, path, indent: int | None = 2, manifest=None, volatile=()):
+        self.path = Path(path)
+        self.indent = indent
+        self.manifest = manifest
+        self.volatile = frozenset(volatile)
+        self.digest = None
+        self.skipped = False
+        self._hash = hashlib.sha256()
+        self._tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        self._file = None
+        self._first_key = True
+
+    # ---------- context manager ----------
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._tmp_path.open("w", encoding="utf-8")
+        self._write("{")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._write("\n}" if self.indent is not None and not self._first_key else "}")
+        finally:
+            self._file.close()
+        if exc_type is not None:
+            self._tmp_path.unlink(missing_ok=True)
+            return False
+
+        self.digest = self._hash.hexdigest()
+        if self.manifest is not None and self.manifest.unchanged(self.path, self.digest):
+            self._tmp_path.unlink()
+            self.skipped = True
+            return False
+
+        os.replace(self._tmp_path, self.path)
+        if self.manifest is not None:
+            self.manifest.record(self.path, self.digest)
+        return False
+
+    # ---------- writing ----------
+
+    def _write(self, text: str, hashed: bool = True):
+        self._file.write(text)
+        if hashed:
+            self._hash.update(text.encode("utf-8"))
+
+    def _dumps(self, value, depth: int) -> str:
+        if self.indent is None:
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        text = json.dumps(value, ensure_ascii=False, indent=self.indent)
+        return text.replace("\n", "\n" + " " * (self.indent * depth))
+
+    def _newline(self, depth: int) -> str:
+        return "" if self.indent is None else "\n" + " " * (self.indent * depth)
+
+    def _write_key(self, key: str):
+        sep = "" if self._first_key else ","
+        colon = ":" if self.indent is None else ": "
+        self._write(sep + self._newline(1) + json.dumps(key, ensure_ascii=False) + colon)
+        self._first_key = False
+
+    def write_value(self, key: str, value):
+        """Write one `"key": value` member (left out of the content hash if `key` is volatile)."""
+        self._write_key(key)
+        self._write(self._dumps(value, 1), hashed=key not in self.volatile)
+
+    def write_list(self, key: str, items) -> int:
+        """Write `"key": [...]` from any iterable, one element at a time; return the element count."""
+        self._write_key(key)
+        self._write("[")
+        count = 0
+        for item in items:
+            self._write(("," if count else "") + self._newline(2) + self._dumps(item, 2))
+            count += 1
+        self._write((self._newline(1) if count else "") + "]")
+        return count
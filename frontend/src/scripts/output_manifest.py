@@ -0,0 +1,103 @@
+# frontend/src/scripts/output_manifest.py
+"""
+Sidecar manifest of content hashes for the exported public/ files.
+
+JsonStreamWriter hashes everything it writes except volatile members
+(e.g. events.json's generatedAt). When the hash matches the one recorded
+here and the file on disk is still the one written then (same size and
+mtime_ns), the write is skipped, so unchanged data keeps its bytes and
+mtime and downstream caches stay warm; a file replaced behind the
+exporter's back (git checkout, a manual edit) no longer matches and is
+rewritten. The manifest maps each file (relative to public/) to its hash,
+which the frontend or deploy tooling can use for cache-busting names such
+as events.<hash>.json.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+
+from cms_client import PROJECT_FRONTEND
+
+MANIFEST_PATH = PROJECT_FRONTEND / "public" / "export-manifest.json"
+
+
+def _stat(path) -> list | None:
+    """[size, mtime_ns] of `path`, or None when it doesn't exist."""
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+class OutputManifest:
+    """In-memory view of export-manifest.json, safe to share between exporter threads."""
+
+    def __init__(self, path=MANIFEST_PATH, files: dict | None = None, stats: dict | None = None):
+        self.path = Path(path)
+        self.files = dict(files or {})
+        # {relative path: [size, mtime_ns]} of each file as it was when its hash was recorded
+        self.stats = dict(stats or {})
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path=MANIFEST_PATH) -> "OutputManifest":
+        try:
+            with Path(path).open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            files, stats = data.get("files", {}), data.get("stats", {})
+        except (OSError, ValueError):
+            files, stats = {}, {}
+        return cls(path, files, stats)
+
+    def _key(self, path) -> str:
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.path.parent.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def unchanged(self, path, digest: str) -> bool:
+        """True when `path` was last written with this content hash and hasn't been touched since."""
+        key = self._key(path)
+        stat = _stat(path)
+        with self._lock:
+            return stat is not None and self.files.get(key) == digest and self.stats.get(key) == stat
+
+    def record(self, path, digest: str):
+        """Note that `path` now holds content with this hash (call right after writing it)."""
+        key = self._key(path)
+        stat = _stat(path)
+        with self._lock:
+            if self.files.get(key) != digest or self.stats.get(key) != stat:
+                self.files[key] = digest
+                self.stats[key] = stat
+                self._dirty = True
+
+    def forget(self, path):
+        key = self._key(path)
+        with self._lock:
+            if self.files.pop(key, None) is not None:
+                self._dirty = True
+            self.stats.pop(key, None)
+
+    def entries(self) -> dict:
+        """Snapshot of {relative path: hash}."""
+        with self._lock:
+            return dict(self.files)
+
+    def save(self):
+        """Write the manifest (atomically) if anything changed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump({"files": dict(sorted(self.files.items())),
+                           "stats": dict(sorted(self.stats.items()))}, f, indent=2)
+                f.write("\n")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
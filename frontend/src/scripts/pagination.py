@@ -0,0 +1,75 @@
+# frontend/src/scripts/pagination.py
+"""
+Parallel skip/limit pagination for client.entries().
+
+The first page is fetched on its own to learn `total`; the remaining pages
+are then requested through a bounded thread pool and merged back in skip
+order, so the result is identical to walking the pages one at a time.
+"""
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from contentful.errors import RateLimitExceededError
+from raw_entries import fetch_page as fetch_raw_page
+
+# Upper bound on in-flight page requests; keep well under the CDA rate limit.
+MAX_WORKERS = int(os.getenv("CONTENTFUL_FETCH_WORKERS", "4"))
+
+
+def _entries_page(client, query: dict) -> tuple[list, int]:
+    """(entries, total) for one page; raw-mode clients go through raw_entries instead of ResourceBuilder."""
+    if getattr(client, "raw_mode", False):
+        return fetch_raw_page(client, query)
+    page = client.entries(query)
+    items = list(page)
+    return items, getattr(page, "total", len(items))
+
+def _fetch_page(client, query: dict, limit: int, skip: int) -> list:
+    return _entries_page(client, {**query, "limit": limit, "skip": skip})[0]
+
+def iter_all_pages(client, query: dict, limit: int = 100, max_workers: int = MAX_WORKERS):
+    """
+    Yield every entry matching `query` in skip order, one page at a time as
+    soon as it (and every page before it) is in, so callers can stream
+    server-ordered results without holding them all: at most `max_workers`
+    pages are requested or waiting ahead of the one being consumed.
+    """
+    items, total = _entries_page(client, {**query, "limit": limit, "skip": 0})
+    yield from items
+    skips = list(range(limit, total, limit))
+    if not skips or not items:
+        return
+
+    workers = max(1, min(max_workers, len(skips)))
+    remaining = iter(skips)
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        def submit_next():
+            skip = next(remaining, None)
+            if skip is not None:
+                in_flight.append((skip, pool.submit(_fetch_page, client, query, limit, skip)))
+
+        for _ in range(workers):
+            submit_next()
+        throttled = False
+        while in_flight:
+            skip, future = in_flight.popleft()
+            if not throttled and isinstance(future.exception(), RateLimitExceededError):
+                # Each request already went through the SDK's retry_request backoff;
+                # stop adding pressure and let the remaining pages go one at a time.
+                throttled = True
+                for _, pending in in_flight:
+                    pending.cancel()
+            if not throttled:
+                submit_next()  # keep the pool busy while this page is consumed
+            if future.cancelled() or isinstance(future.exception(), RateLimitExceededError):
+                yield from _fetch_page(client, query, limit, skip)
+            else:
+                yield from future.result()
+    for skip in remaining:
+        yield from _fetch_page(client, query, limit, skip)
+
+def fetch_all_pages(client, query: dict, limit: int = 100, max_workers: int = MAX_WORKERS) -> list:
+    """Fetch every entry matching `query`, in the same order a serial skip loop would."""
+    return list(iter_all_pages(client, query, limit=limit, max_workers=max_workers))
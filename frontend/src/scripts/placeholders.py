@@ -0,0 +1,153 @@
+# frontend/src/scripts/placeholders.py
+"""
+Tiny placeholders for the gallery's album covers (optional stage).
+
+For every cover served by the Images API (images.ctfassets.net; video and
+download hosts ignore its parameters and are skipped) a PLACEHOLDER_WIDTH
+px PNG is requested; responses that aren't image/* or are larger than
+MAX_PREVIEW_BYTES are rejected.
+Its bytes are embedded as a base64 data URI (a blurry preview the page
+can paint before the banner arrives) and its pixels are averaged into a
+dominant color. The color needs Pillow, which is not vendored and so is
+optional (like brotli in precompress.py); without it placeholders carry
+only the preview. Thumbnails are fetched on a bounded thread pool and the
+results are cached on disk, keyed by asset URL: Contentful URLs hold the
+asset id plus a token that changes with every upload, so a key only goes
+stale when the file itself is replaced and later builds fetch only new
+covers.
+
+Set PLACEHOLDER_ORIGIN (e.g. http://127.0.0.1:8000) to fetch thumbnails
+from a local stand-in for images.ctfassets.net.
+"""
+import base64
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+try:
+    from PIL import Image, ImageStat
+except ImportError:
+    Image = ImageStat = None
+
+from cms_client import PROJECT_FRONTEND, env_flag
+
+# Set GALLERY_PLACEHOLDERS=1 to run this stage
+ENABLED = env_flag("GALLERY_PLACEHOLDERS")
+CACHE_PATH = Path(os.getenv("GALLERY_PLACEHOLDER_CACHE", PROJECT_FRONTEND / ".cache" / "placeholders.json"))
+PLACEHOLDER_WIDTH = int(os.getenv("GALLERY_PLACEHOLDER_WIDTH", "16"))
+MAX_WORKERS = int(os.getenv("GALLERY_PLACEHOLDER_WORKERS", "8"))
+# A 16px PNG is well under 1 KB; anything bigger isn't a thumbnail and stays out of index.json
+MAX_PREVIEW_BYTES = int(os.getenv("GALLERY_PLACEHOLDER_MAX_BYTES", "16384"))
+IMAGES_ORIGIN = "https://images.ctfassets.net"
+PLACEHOLDER_ORIGIN = os.getenv("PLACEHOLDER_ORIGIN")
+CACHE_VERSION = 2
+
+
+# ---------- color ----------
+
+def _average_color(data: bytes) -> str | None:
+    """Mean RGB of a thumbnail as #rrggbb; None without Pillow or for bytes it can't decode."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            r, g, b = (round(c) for c in ImageStat.Stat(image.convert("RGB")).mean)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+def placeholder_for(data: bytes, content_type: str = "image/png") -> dict:
+    """{"color": "#rrggbb" or None, "preview": data URI} for a thumbnail's bytes."""
+    return {
+        "color": _average_color(data),
+        "preview": f"data:{content_type};base64,{base64.b64encode(data).decode('ascii')}",
+    }
+
+
+# ---------- fetching ----------
+
+def is_images_api_url(url) -> bool:
+    """True for images.ctfassets.net (and regional images.*.ctfassets.net) URLs."""
+    if not isinstance(url, str):
+        return False
+    host = urlsplit(url).hostname or ""
+    return host.startswith("images.") and host.endswith(".ctfassets.net")
+
+def thumbnail_url(url: str, width: int = PLACEHOLDER_WIDTH) -> str:
+    """Images API URL of a tiny PNG rendition (host swapped for PLACEHOLDER_ORIGIN if set)."""
+    if PLACEHOLDER_ORIGIN and url.startswith(IMAGES_ORIGIN):
+        url = PLACEHOLDER_ORIGIN.rstrip("/") + url[len(IMAGES_ORIGIN):]
+    sep = "&" if "?" in url else "?"
+    return f"{url}{sep}w={width}&fm=png"
+
+def _load_cache(path: Path) -> dict:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION or cache.get("width") != PLACEHOLDER_WIDTH:
+        return {}
+    return cache.get("placeholders", {})
+
+def _save_cache(path: Path, placeholders: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "width": PLACEHOLDER_WIDTH, "placeholders": placeholders},
+                  f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def fetch_placeholders(urls, cache_path: Path = CACHE_PATH, session=None,
+                       max_workers: int = MAX_WORKERS, timeout_s: float = 10) -> dict:
+    """
+    Return {url: placeholder} for the given image URLs, fetching only those not
+    cached yet. Failed fetches are left out (and retried on the next build).
+    """
+    cache = _load_cache(cache_path)
+    wanted = [u for u in dict.fromkeys(urls) if u and is_images_api_url(u)]
+    missing = [u for u in wanted if u not in cache]
+
+    if missing:
+        own_session = session is None
+        session = session or requests.Session()
+
+        def fetch(url):
+            try:
+                with session.get(thumbnail_url(url), timeout=timeout_s, stream=True) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+                    if not content_type.startswith("image/"):
+                        return url, None
+                    data = b""
+                    for chunk in response.iter_content(4096):
+                        data += chunk
+                        if len(data) > MAX_PREVIEW_BYTES:
+                            return url, None
+            except requests.RequestException:
+                return url, None
+            return url, placeholder_for(data, content_type)
+
+        failed = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as pool:
+                for url, placeholder in pool.map(fetch, missing):
+                    if placeholder is None:
+                        failed += 1
+                    else:
+                        cache[url] = placeholder
+        finally:
+            if own_session:
+                session.close()
+        if failed:
+            print(f"Placeholders: {failed} thumbnail(s) could not be fetched or were not small images")
+
+        # Keep only what is still in use, so the cache doesn't grow forever
+        _save_cache(cache_path, {u: cache[u] for u in wanted if u in cache})
+
+    return {u: cache[u] for u in wanted if u in cache}
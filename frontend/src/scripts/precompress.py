@@ -0,0 +1,85 @@
+# frontend/src/scripts/precompress.py
+"""
+Precompressed .gz (and .br) siblings for the exported public/ files.
+
+Runs after the exporters: every file recorded in the OutputManifest gets
+a gzip copy, plus a brotli copy when the `brotli` package is importable
+(it is not vendored, so this is optional). Work is spread over a thread
+pool since zlib/brotli release the GIL. Each artifact is recorded in the
+manifest under the source hash it was built from, so unchanged sources
+are not recompressed, and artifacts whose source disappeared are removed.
+"""
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from cms_client import env_flag
+
+# Set EXPORT_PRECOMPRESS=0 to skip this stage
+ENABLED = env_flag("EXPORT_PRECOMPRESS", default=True)
+MAX_WORKERS = int(os.getenv("EXPORT_PRECOMPRESS_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output byte-for-byte reproducible
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+def _brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+CODECS = {".gz": _gzip}
+if brotli is not None:
+    CODECS[".br"] = _brotli
+
+
+def _is_artifact(key: str) -> bool:
+    return any(key.endswith(ext) for ext in (".gz", ".br"))
+
+def _compress(source: Path, target: Path, codec):
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    tmp_path.write_bytes(codec(source.read_bytes()))
+    os.replace(tmp_path, target)
+
+def precompress_outputs(manifest, max_workers: int = MAX_WORKERS) -> int:
+    """Bring .gz/.br artifacts in line with the manifest; return how many were (re)written."""
+    root = manifest.path.parent
+    files = manifest.entries()
+
+    jobs = []
+    for key, digest in files.items():
+        if _is_artifact(key):
+            source_key = key[:-3]
+            if source_key not in files:
+                # Source was removed (e.g. a deleted album shard); drop its artifacts too
+                (root / key).unlink(missing_ok=True)
+                manifest.forget(root / key)
+            continue
+
+        source = root / key
+        if not source.exists():
+            continue
+        for ext, codec in CODECS.items():
+            target = root / (key + ext)
+            fresh = (
+                manifest.unchanged(target, digest)
+                and target.stat().st_mtime >= source.stat().st_mtime
+            )
+            if not fresh:
+                jobs.append((source, target, codec, digest))
+
+    if not jobs:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as pool:
+        futures = [(pool.submit(_compress, source, target, codec), target, digest)
+                   for source, target, codec, digest in jobs]
+        for future, target, digest in futures:
+            future.result()
+            manifest.record(target, digest)
+    return len(jobs)
@@ -0,0 +1,181 @@
+# frontend/src/scripts/raw_entries.py
+"""
+Export fast path for Client(raw_mode=True).
+
+In raw mode the SDK hands back the HTTP response untouched. fetch_page()
+turns one /entries page into RawEntry / RawAsset objects that expose what
+events.py and gallery.py read from SDK resources (sys, id, fields(),
+field attributes, Asset.url()), without ResourceBuilder's deepcopy,
+dateutil sys parsing and per-link scans over the includes: every item and
+include of the page is indexed by (type, id) once and links are looked up
+there.
+
+Only what the exporters depend on is coerced: links (resolved, dropped
+when the CDA reports them unresolvable, left as RawLink when not included)
+and Date fields (datetime). sys timestamps stay ISO strings and other field
+types keep their JSON value, so this is not a general SDK replacement.
+"""
+from datetime import datetime
+
+import dateutil.parser
+from contentful.content_type_cache import ContentTypeCache
+from contentful.errors import get_error
+from contentful.utils import is_link, is_link_array, snake_case
+
+# sys entries that hold a link, as in Resource._hydrate_sys
+_SYS_LINKS = ("space", "contentType", "environment")
+
+
+def _parse_date(value: str):
+    """Same result as the SDK's DateField (dateutil), via the much cheaper fromisoformat when it can."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dateutil.parser.parse(value)
+
+
+class RawLink:
+    """A link whose target is not part of the page, like contentful.Link."""
+
+    __slots__ = ("sys",)
+
+    def __init__(self, link: dict):
+        self.sys = {snake_case(k): v for k, v in link["sys"].items()}
+
+    @property
+    def id(self):
+        return self.sys.get("id")
+
+    @property
+    def link_type(self):
+        return self.sys.get("link_type")
+
+    def __repr__(self):
+        return "<RawLink[{0}] id='{1}'>".format(self.link_type, self.id)
+
+
+class RawResource:
+    """Entry/Asset stand-in: snake_cased sys and fields, fields readable as attributes."""
+
+    __slots__ = ("sys", "_fields")
+
+    def __init__(self, item: dict):
+        sys_obj = {}
+        for k, v in item.get("sys", {}).items():
+            if k in _SYS_LINKS:
+                v = RawLink(v)
+            sys_obj[snake_case(k)] = v
+        self.sys = sys_obj
+        self._fields = {}
+
+    @property
+    def id(self):
+        return self.sys.get("id")
+
+    def fields(self, locale=None):
+        return self._fields
+
+    def __getattr__(self, name):
+        if name in self._fields:
+            return self._fields[name]
+        if name in self.sys:
+            return self.sys[name]
+        raise AttributeError(
+            "'{0}' object has no attribute '{1}'".format(self.__class__.__name__, name)
+        )
+
+
+class RawEntry(RawResource):
+    __slots__ = ()
+
+    def __repr__(self):
+        content_type = self.sys.get("content_type")
+        return "<RawEntry[{0}] id='{1}'>".format(content_type.id if content_type else "", self.id)
+
+
+class RawAsset(RawResource):
+    __slots__ = ()
+
+    def url(self, **kwargs):
+        """Same as contentful.Asset.url()."""
+        file_obj = self._fields.get("file")
+        if not file_obj:
+            return ""
+        url = file_obj["url"]
+        args = ["{0}={1}".format(k, v) for k, v in kwargs.items()]
+        if args:
+            url += "?{0}".format("&".join(args))
+        return url
+
+    def __repr__(self):
+        return "<RawAsset id='{0}' url='{1}'>".format(self.id, self.url())
+
+
+def _date_field_ids(item: dict) -> frozenset:
+    """Ids of the Date fields of an entry's content type (empty when it isn't cached)."""
+    sys_obj = item.get("sys", {})
+    try:
+        space_id = sys_obj["space"]["sys"]["id"]
+        content_type_id = sys_obj["contentType"]["sys"]["id"]
+    except KeyError:
+        return frozenset()
+    content_type = ContentTypeCache.get(space_id, content_type_id)
+    if content_type is None:
+        return frozenset()
+    return frozenset(f.raw.get("id") for f in content_type.fields if f.type == "Date")
+
+def build_page(payload: dict) -> list:
+    """
+    RawEntry/RawAsset objects for payload["items"], links resolved against the
+    page's items and includes. Resources are created first and their fields
+    filled afterwards, so entries linking to each other share one object.
+    """
+    index, pending = {}, []
+    includes = payload.get("includes") or {}
+    for item in [*payload.get("items", ()), *includes.get("Entry", ()), *includes.get("Asset", ())]:
+        sys_obj = item.get("sys", {})
+        key = (sys_obj.get("type"), sys_obj.get("id"))
+        if key in index:
+            continue  # items can be repeated under includes
+        resource = index[key] = (RawAsset if key[0] == "Asset" else RawEntry)(item)
+        pending.append((resource, item))
+
+    # Like contentful.utils.unresolvable(): any reported error about that id
+    unresolvable = {
+        error.get("details", {}).get("id") for error in payload.get("errors", ())
+    }
+
+    def resolve(link: dict):
+        sys_obj = link["sys"]
+        if sys_obj.get("id") in unresolvable:
+            return None
+        return index.get((sys_obj.get("linkType"), sys_obj.get("id"))) or RawLink(link)
+
+    date_fields = {}
+    for resource, item in pending:
+        content_type = item.get("sys", {}).get("contentType")
+        ct_key = content_type["sys"].get("id") if content_type else None
+        dates = date_fields.get(ct_key)
+        if dates is None:
+            dates = date_fields[ct_key] = _date_field_ids(item) if ct_key else frozenset()
+
+        fields = resource._fields
+        for k, v in (item.get("fields") or {}).items():
+            if k in dates and isinstance(v, str):
+                v = _parse_date(v)
+            elif is_link(v):
+                v = resolve(v)
+            elif is_link_array(v):
+                v = [r for r in map(resolve, v) if r is not None]
+            fields[snake_case(k)] = v
+
+    return [index[(i["sys"].get("type"), i["sys"].get("id"))] for i in payload.get("items", ())]
+
+def fetch_page(client, query: dict) -> tuple[list, int]:
+    """One client.entries() call on a raw-mode client; returns (entries, total)."""
+    response = client.entries(query)
+    if response.status_code != 200:
+        raise get_error(response)
+    payload = response.json()
+    items = build_page(payload)
+    return items, payload.get("total", len(items))
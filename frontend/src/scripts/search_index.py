@@ -0,0 +1,54 @@
+# frontend/src/scripts/search_index.py
+"""
+Token index for the gallery search box.
+
+    {
+      "albums": ["<slug>", ...],
+      "tokens": {"<token>": [<album position>, ...], ...}
+    }
+
+Tokens are the lowercased runs of letters/digits in each album's name, its
+items' titles and its assets' titles; keys are written sorted so the page
+can binary-search the key list for every token starting with what was
+typed, then intersect the posting lists across the words of the query.
+Gallery.jsx tokenizes queries the same way (tokenize() below).
+"""
+import re
+
+from json_stream import JsonStreamWriter
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text) -> list:
+    """Lowercased letter/digit runs of `text` ("Youth Retreat '24" -> ["youth", "retreat", "24"])."""
+    return _TOKEN.findall(text.lower()) if isinstance(text, str) else []
+
+def album_tokens(album: dict) -> set:
+    """Every token of an album's name, item titles and asset titles."""
+    tokens = set(tokenize(album.get("name")))
+    for item in album.get("items", ()):
+        tokens.update(tokenize(item.get("title")))
+        for asset in item.get("assets") or ():
+            tokens.update(tokenize(asset.get("title")))
+    return tokens
+
+def build_search_index(slugged_albums) -> dict:
+    """Index for (slug, album) pairs, in album order."""
+    slugs, postings = [], {}
+    for position, (slug, album) in enumerate(slugged_albums):
+        slugs.append(slug)
+        for token in album_tokens(album):
+            postings.setdefault(token, []).append(position)
+    return {
+        "albums": slugs,
+        "tokens": dict(sorted(postings.items())),
+    }
+
+def write_search_index(slugged_albums, out_path, manifest=None) -> int:
+    """Write the index as compact JSON (it is only ever machine-read); return the token count."""
+    index = build_search_index(slugged_albums)
+    with JsonStreamWriter(out_path, indent=None, manifest=manifest) as out:
+        out.write_value("albums", index["albums"])
+        out.write_value("tokens", index["tokens"])
+    return len(index["tokens"])
@@ -0,0 +1,167 @@
+# frontend/src/scripts/sync_snapshot.py
+"""
+Incremental export support built on the Contentful Sync API.
+
+A snapshot is a JSON file holding the last sync token(s) plus the raw
+entries (and optionally assets) seen so far. Each run applies only the
+deltas since the stored token, then rebuilds regular SDK Entry objects
+from the snapshot so the exporters' transforms don't need to change.
+"""
+import json
+import os
+from pathlib import Path
+
+from contentful import DeletedAsset, DeletedEntry
+from contentful.resource_builder import ResourceBuilder
+
+SNAPSHOT_VERSION = 1
+
+
+# ---------- snapshot file ----------
+
+def _empty_snapshot(client, content_type_id: str, with_assets: bool) -> dict:
+    return {
+        "version": SNAPSHOT_VERSION,
+        "space": client.space_id,
+        "environment": client.environment,
+        "contentType": content_type_id,
+        "withAssets": with_assets,
+        "tokens": {},
+        "entries": {},
+        "assets": {},
+    }
+
+def load_snapshot(path: Path, client, content_type_id: str, with_assets: bool = False) -> dict:
+    """Read a snapshot from disk; start fresh if it is missing or was built for another space/query."""
+    fresh = _empty_snapshot(client, content_type_id, with_assets)
+    try:
+        with Path(path).open("r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return fresh
+
+    for key in ("version", "space", "environment", "contentType", "withAssets"):
+        if snapshot.get(key) != fresh[key]:
+            return fresh
+    return snapshot
+
+def save_snapshot(path: Path, snapshot: dict):
+    """Write the snapshot atomically so an interrupted build never leaves a half-written token."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+# ---------- applying deltas ----------
+
+def _sync_stream(client, snapshot: dict, stream: str, initial_query: dict) -> int:
+    """Run one sync stream (Entry or Asset) to completion and fold its items into the snapshot."""
+    token = snapshot["tokens"].get(stream)
+    query = {"sync_token": token} if token else dict(initial_query, initial=True)
+    page = client.sync(query)
+
+    changed = 0
+    while True:
+        for item in page.items:
+            if isinstance(item, DeletedEntry):
+                changed += snapshot["entries"].pop(item.id, None) is not None
+            elif isinstance(item, DeletedAsset):
+                changed += snapshot["assets"].pop(item.id, None) is not None
+            elif item.type == "Asset":
+                snapshot["assets"][item.id] = item.raw
+                changed += 1
+            elif item.type == "Entry":
+                snapshot["entries"][item.id] = item.raw
+                changed += 1
+        if not page.next_page_url:
+            break
+        page = page.next(client)
+
+    snapshot["tokens"][stream] = page.next_sync_token
+    return changed
+
+def sync_snapshot(client, snapshot: dict) -> int:
+    """Bring the snapshot up to date in place; return how many entries/assets changed."""
+    changed = _sync_stream(client, snapshot, "Entry", {
+        "type": "Entry",
+        "content_type": snapshot["contentType"],
+    })
+    if snapshot["withAssets"]:
+        changed += _sync_stream(client, snapshot, "Asset", {"type": "Asset"})
+    return changed
+
+
+# ---------- rebuilding entries ----------
+
+def _delocalize(item: dict, locale: str) -> dict:
+    """Sync items carry every locale ({"field": {"en-US": v}}); keep just one, like a CDA response."""
+    fields = {}
+    for k, v in (item.get("fields") or {}).items():
+        if isinstance(v, dict) and locale in v:
+            fields[k] = v[locale]
+    return {**item, "sys": {**item["sys"], "locale": locale}, "fields": fields}
+
+def _linked_ids(fields: dict, link_type: str):
+    for v in fields.values():
+        for candidate in (v if isinstance(v, list) else [v]):
+            sys_obj = candidate.get("sys", {}) if isinstance(candidate, dict) else {}
+            if sys_obj.get("type") == "Link" and sys_obj.get("linkType") == link_type:
+                yield sys_obj.get("id")
+
+def space_default_locale(client) -> str:
+    """
+    Code of the locale marked default in the client's environment. This is what the
+    CDA serves when no locale is requested; client.default_locale is only a client-side
+    setting ("en-US" unless overridden) and need not match it.
+    """
+    for locale in client.locales():
+        if locale.default:
+            return locale.code
+    return client.default_locale
+
+def snapshot_entries(client, snapshot: dict, locale: str | None = None) -> list:
+    """
+    Rebuild SDK Entry objects from the snapshot, ordered by sys.createdAt like a fresh fetch.
+    Fields are taken from `locale`, by default the environment's default locale.
+    """
+    locale = locale or space_default_locale(client)
+    items = [_delocalize(e, locale) for e in snapshot["entries"].values()]
+    items.sort(key=lambda e: (e["sys"].get("createdAt", ""), e["sys"].get("id", "")))
+
+    includes, errors, seen = [], [], set()
+    if snapshot["withAssets"]:
+        # Mimic the CDA: linked assets go under includes, missing ones are reported
+        # as notResolvable so the SDK drops them instead of leaving bare Links.
+        for e in items:
+            for asset_id in _linked_ids(e["fields"], "Asset"):
+                if asset_id in seen:
+                    continue
+                seen.add(asset_id)
+                asset = snapshot["assets"].get(asset_id)
+                if asset is not None:
+                    includes.append(_delocalize(asset, locale))
+                else:
+                    errors.append({
+                        "sys": {"id": "notResolvable", "type": "error"},
+                        "details": {"type": "Link", "linkType": "Asset", "id": asset_id},
+                    })
+
+    payload = {
+        "sys": {"type": "Array"},
+        "total": len(items),
+        "skip": 0,
+        "limit": len(items),
+        "items": items,
+        "includes": {"Asset": includes},
+        "errors": errors,
+    }
+    return list(ResourceBuilder(
+        locale,
+        False,
+        payload,
+        max_depth=client.max_include_resolution_depth,
+        reuse_entries=client.reuse_entries,
+    ).build())